@@ -4,24 +4,218 @@ This module defines the CANManager and CANWorker classes, which handle
 CAN device detection, message retransmission, and threading.
 """
 
+import array
 import contextlib
 import ctypes
+import errno
 import logging
+import os
 import platform
+import queue
+import re
+import selectors
+import sys
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import can
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QMetaObject, QObject, Qt, QThread, pyqtSignal, pyqtSlot
 
 from .frame_logger import FrameLogger
 
+_log = logging.getLogger(__name__)
+
+# Host OS, resolved once; selects the device detection backends
+_PLATFORM = platform.system()
+
+# Rewrite rules on standard (11-bit) IDs are looked up through a flat array; rules on
+# extended IDs spill over into a dict
+_RULE_TABLE_MAX_ID = 0x7FF
+
+# Adaptive TX gap controller: grow the inter-send gap while send latency stays above target,
+# shrink it once latency has been comfortably low for a while.
+_TX_LATENCY_TARGET = 0.005  # seconds
+_TX_LATENCY_EWMA_ALPHA = 0.1
+_TX_GAP_GROW_AFTER = 0.1  # seconds above target before growing
+_TX_GAP_SHRINK_AFTER = 0.5  # seconds below target/2 before shrinking
+_TX_GAP_MIN_STEP = 0.0001  # seconds; lets the gap grow from zero
+_TX_GAP_MAX = 0.02  # seconds
+
+# Frames are reported to the GUI/logger in lists: flushed when the oldest is one redraw
+# old (~60 Hz), or earlier if a burst fills the list
+_FRAME_BATCH_MAX = 256
+_FRAME_BATCH_INTERVAL = 1 / 60  # seconds
+
+# recv() timeout for backends without a pollable handle while no batch is pending; their
+# drivers wake recv() as soon as a frame arrives, so this only bounds stop() latency
+_IDLE_RECV_TIMEOUT = 0.1  # seconds
+
+# After a wakeup, frames already queued by the driver are drained with non-blocking
+# recv() calls, up to this many, before the other direction gets its turn
+_RX_BURST_MAX = 64
+
+# Frames evicted by the drop-oldest policy are reported as one count per interval
+_DROP_REPORT_INTERVAL = 1.0  # seconds
+
+# Up to this many acceptance filters are pushed to the input bus for the rewrite rules
+_MAX_HW_FILTERS = 64
+
+# Detected channel lists are reused for this long before the backends are enumerated again
+_CHANNEL_CACHE_TTL = 30.0  # seconds
+
+# How long stop_retransmission waits for the worker thread before giving up on it
+_STOP_WAIT_MS = 5000
+
+# SocketCAN link names (can0, can1, ...) accepted when pyroute2 is unavailable or fails
+_CAN_IF_RE = re.compile(r"can\d+")
+
+# Send errors meaning "TX queue full": OS errnos (SocketCAN) and vendor status codes
+# carried in CanError.error_code, keyed by the module that defines the exception type
+_OVERFLOW_ERRNOS = frozenset({errno.ENOBUFS, errno.EAGAIN})
+_OVERFLOW_ERROR_CODES = {
+    "can.interfaces.kvaser.canlib": -13,  # canERR_TXBUFOFL
+    "can.interfaces.vector.exceptions": 11,  # XL_ERR_QUEUE_IS_FULL
+}
+
+# Common patterns across backends for TX queue saturation (backends without codes)
+_OVERFLOW_RE = re.compile(r"overflow|tx buffer|transmit buffer|transmit queue|-13", re.IGNORECASE)
+
+
+def _build_rule_table(rules: dict[int, int]) -> tuple[array.array | None, dict[int, int]]:
+    """Split rewrite rules into an array for 11-bit IDs and a dict for the rest.
+
+    The array is indexed by arbitration ID, ends at the highest standard ID with a
+    rule, and holds -1 in slots without one; it is None when no rule has a standard
+    ID. Rules on extended IDs are returned in the spillover dict.
+    """
+    standard = {k: v for k, v in rules.items() if 0 <= k <= _RULE_TABLE_MAX_ID}
+    spillover = {k: v for k, v in rules.items() if k not in standard}
+    if not standard:
+        return None, spillover
+    table = array.array("i", [-1]) * (max(standard) + 1)
+    for original_id, rewritten_id in standard.items():
+        table[original_id] = rewritten_id
+    return table, spillover
+
+
+def _is_tx_overflow(e: Exception) -> bool:
+    """Return True if a send error means the TX buffer/queue is full.
+
+    Structured information (the wrapped OSError's errno, or a known backend's
+    error_code) decides on its own; the message text is only searched when the
+    backend provides neither.
+    """
+    cause = e.__cause__
+    if isinstance(cause, OSError) and cause.errno is not None:
+        return cause.errno in _OVERFLOW_ERRNOS
+    overflow_code = _OVERFLOW_ERROR_CODES.get(type(e).__module__)
+    if overflow_code is not None:
+        error_code = getattr(e, "error_code", None)
+        if error_code is not None:
+            return error_code == overflow_code
+    return _OVERFLOW_RE.search(str(e)) is not None
+
+
+class _TxPacing:
+    """Inter-send gap and send-latency state of one TX pump.
+
+    Each pump (one per destination bus) owns its instance, so the adaptive gap of one
+    direction is never computed from the other bus's timings and needs no lock.
+    """
+
+    def __init__(self, min_gap: float):
+        self.min_gap = min_gap  # seconds; adjusted at run time with adaptive_tx_gap
+        self.floor = min_gap  # the configured gap, which adaptation never goes below
+        self.last_tx_time = 0.0  # time.monotonic() of the last successful send
+        self.lat_ewma = 0.0
+        self.above_since = 0.0
+        self.below_since = 0.0
+
+    def update(self, send_latency: float, now: float) -> None:
+        """Adjust the inter-send gap from the smoothed ``bus.send`` latency.
+
+        Latency above target for _TX_GAP_GROW_AFTER grows the gap by 2%; latency below
+        half the target for _TX_GAP_SHRINK_AFTER shrinks it by 2%. The gap stays within
+        [configured tx_min_gap, _TX_GAP_MAX].
+        """
+        ewma = self.lat_ewma + _TX_LATENCY_EWMA_ALPHA * (send_latency - self.lat_ewma)
+        self.lat_ewma = ewma
+        if ewma > _TX_LATENCY_TARGET:
+            self.below_since = 0.0
+            if not self.above_since:
+                self.above_since = now
+            elif now - self.above_since >= _TX_GAP_GROW_AFTER:
+                grown = max(self.min_gap * 1.02, _TX_GAP_MIN_STEP)
+                self.min_gap = min(grown, max(_TX_GAP_MAX, self.floor))
+                self.above_since = now
+        elif ewma < _TX_LATENCY_TARGET / 2:
+            self.above_since = 0.0
+            if not self.below_since:
+                self.below_since = now
+            elif now - self.below_since >= _TX_GAP_SHRINK_AFTER:
+                shrunk = self.min_gap * 0.98
+                if shrunk < _TX_GAP_MIN_STEP:
+                    shrunk = 0.0
+                self.min_gap = max(shrunk, self.floor)
+                self.below_since = now
+        else:
+            self.above_since = 0.0
+            self.below_since = 0.0
+
+
+class _FrameBatch:
+    """Thread-safe accumulator of (msg, channel) pairs emitted as one list per flush.
+
+    A cross-thread Qt signal per frame is far more expensive than one per batch, so
+    frames are collected until _FRAME_BATCH_MAX is reached or the oldest pending frame
+    is _FRAME_BATCH_INTERVAL old.
+    """
+
+    def __init__(self, emit: Callable[[list], None]):
+        self._emit = emit
+        self._frames: list[tuple[can.Message, int]] = []
+        self._first_time = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def add(self, msg: can.Message, channel: int) -> None:
+        with self._lock:
+            frames = self._frames
+            if not frames:
+                self._first_time = time.monotonic()
+            frames.append((msg, channel))
+            if (
+                len(frames) < _FRAME_BATCH_MAX
+                and time.monotonic() - self._first_time < _FRAME_BATCH_INTERVAL
+            ):
+                return
+            self._frames = []
+        self._emit(frames)
+
+    def flush(self, *, force: bool = False) -> None:
+        """Emit pending frames if the oldest one is due (or unconditionally with force)."""
+        with self._lock:
+            frames = self._frames
+            if not frames:
+                return
+            if not force and time.monotonic() - self._first_time < _FRAME_BATCH_INTERVAL:
+                return
+            self._frames = []
+        self._emit(frames)
+
 
 class CANWorker(QObject):
     """Worker object that performs the CAN retransmission in a separate thread."""
 
-    frame_received = pyqtSignal(object, int)  # msg, channel
-    frame_retransmitted = pyqtSignal(object, int)  # msg, channel
+    # Frames are reported in batches, each a list of (msg, channel) tuples
+    frames_received_batch = pyqtSignal(list)  # [(msg, channel), ...]
+    frames_retransmitted_batch = pyqtSignal(list)  # [(msg, channel), ...]
     error_occurred = pyqtSignal(str)
+    tx_frames_dropped = pyqtSignal(int)  # frames evicted or failed to send since last report
     # Recovery lifecycle signals
     recovery_started = pyqtSignal()
     recovery_succeeded = pyqtSignal()
@@ -42,6 +236,10 @@ class CANWorker(QObject):
         send_retry_initial_delay: float = 0.01,
         tx_min_gap: float = 0.0,
         tx_overflow_cooldown: float = 0.05,
+        tx_queue_size: int = 256,
+        tx_drop_oldest: bool = False,
+        adaptive_tx_gap: bool = False,
+        forward_unmapped: bool = True,
     ):
         super().__init__()
         # Buses are opened lazily in _open_buses
@@ -50,7 +248,13 @@ class CANWorker(QObject):
         self.input_config = input_config
         self.output_config = output_config
         self.rewrite_rules = rewrite_rules
-        self._is_running = True
+        # Rules are compiled once here; they must not be mutated while the worker runs
+        self._rules_table, rules_spillover = _build_rule_table(rewrite_rules)
+        self._rules_get = rules_spillover.get
+        # When False, Input frames without a rewrite rule are neither reported nor forwarded
+        self._forward_unmapped = bool(forward_unmapped)
+        # Set once by stop(); every loop and wait in the worker checks or waits on it
+        self._stop_event = threading.Event()
         # NFR-REL-001: Auto-recovery parameters
         self._retry_on_busoff = retry_on_busoff
         self._max_retries = max_retries
@@ -64,128 +268,376 @@ class CANWorker(QObject):
         # Adaptive throttling: ensure a minimum gap between sends and cooldown after overflow
         self._tx_min_gap = max(0.0, float(tx_min_gap))  # seconds
         self._tx_overflow_cooldown = max(0.0, float(tx_overflow_cooldown))  # seconds
-        self._last_tx_time = 0.0
+        # Optional feedback loop on send latency; the configured gap acts as its floor
+        self._adaptive_tx_gap = bool(adaptive_tx_gap)
+        # Gap state per TX pump, indexed by TX channel (0 = to Output, 1 = to Input)
+        self._tx_pacing = (_TxPacing(self._tx_min_gap), _TxPacing(self._tx_min_gap))
+        # With no gap, no retries and no cooldown the retry machinery is dead code;
+        # the TX pumps then use a single plain send attempt instead
+        send_fast_path = (
+            self._tx_min_gap == 0.0
+            and self._max_send_retries == 1
+            and self._tx_overflow_cooldown == 0.0
+            and not self._adaptive_tx_gap
+        )
+        self._send_frame: Callable[[can.BusABC, can.Message, _TxPacing], bool] = (
+            self._send_once if send_fast_path else self._send_with_retry_on
+        )
+        # Bounded TX queues decouple receiving from sending: the RX loop only enqueues and a
+        # pump thread per destination bus does the (possibly retried) sends. When a queue is
+        # full the RX loop either waits (back-pressure) or evicts the oldest pending frame.
+        self._tx_queue_to_output: queue.Queue = queue.Queue(maxsize=max(1, int(tx_queue_size)))
+        self._tx_queue_to_input: queue.Queue = queue.Queue(maxsize=max(1, int(tx_queue_size)))
+        self._tx_drop_oldest = bool(tx_drop_oldest)
+        # Frames lost to drop-oldest or to failed sends; counted from the RX and TX threads
+        self._tx_dropped = 0
+        self._tx_dropped_reported = 0
+        self._drop_report_time = 0.0
+        self._drop_lock = threading.Lock()
+        self._tx_stop = threading.Event()
+        self._tx_threads: list[threading.Thread] = []
+        # Polling backends only: Output -> Input receive runs on its own thread and hands
+        # any bus error back to run(), which owns recovery
+        self._rx_out_thread: threading.Thread | None = None
+        self._rx_out_stop = threading.Event()
+        self._rx_out_error: Exception | None = None
+        # Self-pipe that lets stop() wake a selector wait with no timeout
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._wake_lock = threading.Lock()
+        self._rx_batch = _FrameBatch(self.frames_received_batch.emit)
+        self._tx_batch = _FrameBatch(self.frames_retransmitted_batch.emit)
 
     def run(self):
         """The main retransmission loop."""
+        selector: selectors.BaseSelector | None = None
         try:
             if not self._open_buses():
                 raise (self._last_open_error or RuntimeError("Failed to open CAN buses"))
 
-            while self._is_running:
-                # Narrow types for static analysis and ensure buses are ready
-                assert self.input_bus is not None
-                assert self.output_bus is not None
-
-                # Poll Input bus (Input -> Output path with optional rewrite)
-                try:
-                    msg_in = self.input_bus.recv(timeout=0.01)
-                    if msg_in:
-                        self._busoff_streak = 0
-                        new_id = self.rewrite_rules.get(msg_in.arbitration_id)
-                        if new_id is not None:
-                            # Emit RX for frames that will be transformed (received on channel 1)
-                            self.frame_received.emit(msg_in, 1)
-                            new_msg = can.Message(
-                                arbitration_id=new_id,
-                                data=msg_in.data,
-                                dlc=msg_in.dlc,
-                                is_extended_id=msg_in.is_extended_id,
-                                timestamp=time.time(),
-                            )
-                            if self._send_with_retry_on(self.output_bus, new_msg):
-                                self.frame_retransmitted.emit(new_msg, 0)  # to channel 0
-                            else:
-                                self.error_occurred.emit(
-                                    "TX buffer overflow: dropped a rewritten frame after retries"
-                                )
-                        else:
-                            # Emit RX for passthrough frames (received on channel 1)
-                            self.frame_received.emit(msg_in, 1)
-                            # Passthrough silently
-                            retransmitted_msg = can.Message(
-                                arbitration_id=msg_in.arbitration_id,
-                                data=msg_in.data,
-                                dlc=msg_in.dlc,
-                                is_extended_id=msg_in.is_extended_id,
-                                timestamp=time.time(),
-                            )
-                            if self._send_with_retry_on(self.output_bus, retransmitted_msg):
-                                self.frame_retransmitted.emit(retransmitted_msg, 0)  # to ch 0
-                            else:
-                                self.error_occurred.emit(
-                                    "TX buffer overflow: dropped a frame after retries"
-                                )
-                except Exception as e:
-                    # Handle transient CAN errors such as bus-off
-                    text = str(e).lower()
-                    looks_bus_off = ("bus off" in text) or isinstance(
-                        e, (can.CanError, AttributeError)
-                    )
-                    if self._retry_on_busoff and looks_bus_off:
-                        if self._busoff_streak >= max(0, self._max_retries):
-                            self.recovery_failed.emit()
-                            raise can.CanError("bus off") from e
-                        self._busoff_streak += 1
-                        self.recovery_started.emit()
-                        if self._attempt_recovery():
-                            self.recovery_succeeded.emit()
-                            continue
-                        self.recovery_failed.emit()
-                        raise can.CanError("bus off") from e
-                    raise
-
-                # Poll Output bus (Output -> Input path, always passthrough, no rewrite)
+            self._start_tx_pumps()
+            # Per-direction handlers are specialized once with every lookup bound;
+            # they are rebuilt only when recovery reopens the buses
+            rx_batch = self._rx_batch
+            handle_in, handle_out = self._make_rx_handlers()
+            selector = self._make_selector(handle_in, handle_out)
+            if selector is None:
+                self._start_rx_out_thread(handle_out)
+            wake_fd = self._wake_r
+            stopped = self._stop_event.is_set
+            while not stopped():
                 try:
-                    msg_out = self.output_bus.recv(timeout=0.01)
-                    if msg_out:
-                        self._busoff_streak = 0
-                        # Emit RX for frames received on channel 0
-                        self.frame_received.emit(msg_out, 0)
-                        back_msg = can.Message(
-                            arbitration_id=msg_out.arbitration_id,
-                            data=msg_out.data,
-                            dlc=msg_out.dlc,
-                            is_extended_id=msg_out.is_extended_id,
-                            timestamp=time.time(),
-                        )
-                        # Retransmit to Input (channel 1)
-                        if self._send_with_retry_on(self.input_bus, back_msg):
-                            self.frame_retransmitted.emit(back_msg, 1)  # transmitted to channel 1
-                        else:
-                            self.error_occurred.emit(
-                                "TX buffer overflow: dropped a frame after retries"
-                            )
+                    if selector is None:
+                        # Backends without a pollable handle: each direction blocks in its
+                        # own recv, so a quiet Input bus does not delay Output frames
+                        handle_in(_FRAME_BATCH_INTERVAL if rx_batch else _IDLE_RECV_TIMEOUT)
+                        if self._rx_out_error is not None:
+                            raise self._rx_out_error
+                    else:
+                        # Single wait on both buses; only read from those that are ready.
+                        # Block until traffic or stop(), but wake up in time to flush a
+                        # pending RX batch.
+                        timeout = _FRAME_BATCH_INTERVAL if rx_batch else None
+                        for key, _events in selector.select(timeout=timeout):
+                            if key.fd == wake_fd:
+                                with contextlib.suppress(OSError):
+                                    os.read(wake_fd, 64)
+                                continue
+                            key.data(0.0)
+                    rx_batch.flush()
+                    if self._tx_dropped != self._tx_dropped_reported:
+                        self._report_tx_drops()
                 except Exception as e:
-                    text = str(e).lower()
-                    looks_bus_off = ("bus off" in text) or isinstance(
-                        e, (can.CanError, AttributeError)
-                    )
-                    if self._retry_on_busoff and looks_bus_off:
-                        if self._busoff_streak >= max(0, self._max_retries):
-                            self.recovery_failed.emit()
-                            raise can.CanError("bus off") from e
-                        self._busoff_streak += 1
-                        self.recovery_started.emit()
-                        if self._attempt_recovery():
-                            self.recovery_succeeded.emit()
-                            continue
-                        self.recovery_failed.emit()
-                        raise can.CanError("bus off") from e
-                    raise
+                    # Nothing may read from the buses while recovery reopens them
+                    self._stop_rx_out_thread()
+                    self._handle_bus_error(e)
+                    # Buses were reopened: rebuild the handlers and the wait set
+                    handle_in, handle_out = self._make_rx_handlers()
+                    if selector is not None:
+                        selector.close()
+                    selector = self._make_selector(handle_in, handle_out)
+                    if selector is None:
+                        self._start_rx_out_thread(handle_out)
+                    wake_fd = self._wake_r
 
         except Exception as e:
             self.error_occurred.emit(f"Error in CAN worker: {e}")
         finally:
+            if selector is not None:
+                selector.close()
+            self._close_wake_pipe()
+            self._stop_rx_out_thread()
+            self._stop_tx_pumps()
+            self._report_tx_drops(force=True)
+            self._rx_batch.flush(force=True)
+            self._tx_batch.flush(force=True)
             if self.input_bus:
                 self.input_bus.shutdown()
             if self.output_bus:
                 self.output_bus.shutdown()
             self.finished.emit()
 
+    def _make_rx_handlers(self) -> tuple[Callable[[float], None], Callable[[float], None]]:
+        """Build the (Input -> Output, Output -> Input) receive handlers for the open buses.
+
+        Each handler is a closure with the bus, rule lookup, batch and queue bound up
+        front, so the per-frame path does no direction checks and little attribute
+        resolution. Without rewrite rules the Input handler is the plain passthrough
+        variant, with no lookup at all. ``recv`` stays a call-time lookup: a bus that
+        lost it (AttributeError) must fail inside the loop, where it is treated as bus-off.
+
+        A handler waits up to ``timeout`` for the first frame, then drains whatever the
+        driver has already queued (at most _RX_BURST_MAX frames) without blocking, so a
+        burst costs one wakeup instead of one per frame.
+        """
+        in_bus, out_bus = self._bound_buses()
+        enqueue = self._enqueue_tx
+        rx_add = self._rx_batch.add
+
+        def make_passthrough(
+            bus: can.BusABC, rx_channel: int, tx_queue: queue.Queue
+        ) -> Callable[[float], None]:
+            def handle(timeout: float) -> None:
+                """Forward every received frame unchanged; no copy is needed."""
+                msg = bus.recv(timeout=timeout)
+                if not msg:
+                    return
+                self._busoff_streak = 0
+                budget = _RX_BURST_MAX
+                while True:
+                    rx_add(msg, rx_channel)
+                    enqueue(tx_queue, msg)
+                    budget -= 1
+                    if not budget:
+                        return
+                    msg = bus.recv(timeout=0.0)
+                    if not msg:
+                        return
+
+            return handle
+
+        to_output = self._tx_queue_to_output
+        # Output -> Input never rewrites
+        handle_out = make_passthrough(out_bus, 0, self._tx_queue_to_input)
+        if not self.rewrite_rules and self._forward_unmapped:
+            return make_passthrough(in_bus, 1, to_output), handle_out
+
+        table = self._rules_table
+        table_len = len(table) if table is not None else 0
+        rules_get = self._rules_get
+        clone = self._clone
+        forward_unmapped = self._forward_unmapped
+
+        def handle_in(timeout: float) -> None:
+            """Input -> Output path with optional ID rewrite."""
+            msg_in = in_bus.recv(timeout=timeout)
+            if not msg_in:
+                return
+            self._busoff_streak = 0
+            budget = _RX_BURST_MAX
+            while True:
+                arbitration_id = msg_in.arbitration_id
+                if arbitration_id < table_len:
+                    new_id = table[arbitration_id]  # type: ignore[index]
+                else:
+                    new_id = rules_get(arbitration_id, -1)
+                if new_id >= 0:
+                    # Emit RX for every frame received on channel 1, rewritten or passthrough
+                    rx_add(msg_in, 1)
+                    enqueue(to_output, clone(msg_in, new_id))
+                elif forward_unmapped:
+                    # Passthrough frames are forwarded as received
+                    rx_add(msg_in, 1)
+                    enqueue(to_output, msg_in)
+                # Otherwise filtered out: the driver-level filter may not cover every backend
+                budget -= 1
+                if not budget:
+                    return
+                msg_in = in_bus.recv(timeout=0.0)
+                if not msg_in:
+                    return
+
+        return handle_in, handle_out
+
+    def _enqueue_tx(self, tx_queue: queue.Queue, msg: can.Message) -> None:
+        """Hand a frame to a TX pump, applying the configured full-queue policy."""
+        if self._tx_drop_oldest:
+            while True:
+                try:
+                    tx_queue.put_nowait(msg)
+                    return
+                except queue.Full:
+                    # Keep the freshest data: evict the oldest pending frame
+                    with contextlib.suppress(queue.Empty):
+                        tx_queue.get_nowait()
+                        self._count_tx_drop()
+        # Back-pressure: wait for room, but stay responsive to stop()
+        stopped = self._stop_event.is_set
+        while not stopped():
+            try:
+                tx_queue.put(msg, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _count_tx_drop(self) -> None:
+        """Count one frame that will not reach its destination bus."""
+        with self._drop_lock:
+            self._tx_dropped += 1
+
+    def _report_tx_drops(self, *, force: bool = False) -> None:
+        """Report frames dropped since the last report, at most once per interval."""
+        with self._drop_lock:
+            dropped = self._tx_dropped - self._tx_dropped_reported
+            if dropped <= 0:
+                return
+            now = time.monotonic()
+            if not force and now - self._drop_report_time < _DROP_REPORT_INTERVAL:
+                return
+            self._tx_dropped_reported += dropped
+            self._drop_report_time = now
+        self.tx_frames_dropped.emit(dropped)
+
+    def _start_tx_pumps(self) -> None:
+        """Start one TX thread per destination bus."""
+        self._tx_stop.clear()
+        self._tx_threads = [
+            threading.Thread(
+                target=self._tx_pump,
+                args=(self._tx_queue_to_output, lambda: self.output_bus, 0),
+                name="CANTxToOutput",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._tx_pump,
+                args=(self._tx_queue_to_input, lambda: self.input_bus, 1),
+                name="CANTxToInput",
+                daemon=True,
+            ),
+        ]
+        for thread in self._tx_threads:
+            thread.start()
+
+    def _stop_tx_pumps(self) -> None:
+        """Signal the TX threads to exit and wait for them before buses are shut down."""
+        self._tx_stop.set()
+        if not self._tx_threads:
+            return
+        for tx_queue in (self._tx_queue_to_output, self._tx_queue_to_input):
+            # Wake an idle pump; a busy one notices _tx_stop after its current frame
+            with contextlib.suppress(queue.Full):
+                tx_queue.put_nowait(None)
+        for thread in self._tx_threads:
+            thread.join(timeout=2.0)
+        self._tx_threads = []
+
+    def _start_rx_out_thread(self, handle_out: Callable[[float], None]) -> None:
+        """Receive on the Output bus from a dedicated thread (polling backends only)."""
+        self._rx_out_stop.clear()
+        self._rx_out_error = None
+        self._rx_out_thread = threading.Thread(
+            target=self._rx_out_loop, args=(handle_out,), name="CANRxFromOutput", daemon=True
+        )
+        self._rx_out_thread.start()
+
+    def _stop_rx_out_thread(self) -> None:
+        """Stop the Output receive thread, if running, and clear its pending error."""
+        thread = self._rx_out_thread
+        if thread is not None:
+            self._rx_out_stop.set()
+            thread.join(timeout=2.0)
+            self._rx_out_thread = None
+        self._rx_out_error = None
+
+    def _rx_out_loop(self, handle_out: Callable[[float], None]) -> None:
+        """Thread body for Output -> Input receive; errors are left for run() to handle."""
+        stop = self._rx_out_stop
+        rx_batch = self._rx_batch
+        try:
+            while not (self._stop_event.is_set() or stop.is_set()):
+                handle_out(_FRAME_BATCH_INTERVAL if rx_batch else _IDLE_RECV_TIMEOUT)
+                # run() may sit in a long Input recv; flush Output frames from here too
+                rx_batch.flush()
+        except Exception as e:
+            self._rx_out_error = e
+
+    def _tx_pump(
+        self,
+        tx_queue: queue.Queue,
+        get_bus: Callable[[], can.BusABC | None],
+        tx_channel: int,
+    ) -> None:
+        """Send queued frames to the bus returned by ``get_bus`` until stopped.
+
+        The bus is looked up per frame so that handles reopened by recovery are used. A
+        frame that cannot be sent is dropped and counted; the pump carries on with the next
+        one, and the count is reported through tx_frames_dropped like drop-oldest evictions.
+        """
+        # Bound once: the pump runs for the worker's lifetime
+        tx_batch = self._tx_batch
+        batch_add = tx_batch.add
+        send_frame = self._send_frame
+        pacing = self._tx_pacing[tx_channel]
+        get_item = tx_queue.get
+        stopped = self._tx_stop.is_set
+        while not stopped():
+            # Only time out while there are frames or drops waiting to be reported
+            pending = tx_batch or self._tx_dropped != self._tx_dropped_reported
+            try:
+                msg = get_item(timeout=_FRAME_BATCH_INTERVAL if pending else None)
+            except queue.Empty:
+                tx_batch.flush()
+                self._report_tx_drops()
+                continue
+            if msg is None or stopped():
+                break
+            bus = get_bus()
+            if bus is not None and send_frame(bus, msg, pacing):
+                batch_add(msg, tx_channel)
+            else:
+                self._count_tx_drop()
+                self._report_tx_drops()
+
+    @staticmethod
+    def _clone(msg: can.Message, arbitration_id: int) -> can.Message:
+        """Copy a received frame for retransmission under the given arbitration ID."""
+        return can.Message(
+            arbitration_id=arbitration_id,
+            data=msg.data,
+            dlc=msg.dlc,
+            is_extended_id=msg.is_extended_id,
+            # Keep the driver/hardware RX timestamp instead of re-stamping
+            timestamp=msg.timestamp,
+        )
+
+    def _handle_bus_error(self, e: Exception) -> None:
+        """Recover from a transient bus error (e.g. bus-off) or re-raise it.
+
+        Returns normally only when the buses were reopened and the loop may continue.
+        """
+        text = str(e).lower()
+        looks_bus_off = ("bus off" in text) or isinstance(e, (can.CanError, AttributeError))
+        if self._retry_on_busoff and looks_bus_off:
+            if self._busoff_streak >= max(0, self._max_retries):
+                self.recovery_failed.emit()
+                raise can.CanError("bus off") from e
+            self._busoff_streak += 1
+            self.recovery_started.emit()
+            if self._attempt_recovery():
+                self.recovery_succeeded.emit()
+                return
+            self.recovery_failed.emit()
+            raise can.CanError("bus off") from e
+        raise e
+
     def stop(self):
         """Stops the listener loop."""
-        self._is_running = False
+        self._stop_event.set()
+        # Locked so run() cannot close (and the OS reuse) the descriptor mid-write
+        with self._wake_lock:
+            if self._wake_w is not None:
+                with contextlib.suppress(OSError):
+                    os.write(self._wake_w, b"\0")
 
     # ------------------------------------------------------------------
     # Internals
@@ -210,11 +662,83 @@ class CANWorker(QObject):
                 self.output_bus = can.interface.Bus(**out_cfg)
             except TypeError:
                 self.output_bus = can.interface.Bus(**self.output_config)
+
+            if not self._forward_unmapped:
+                self._apply_input_filters(self.input_bus)
             return True
         except Exception as e:
             self._last_open_error = e
             return False
 
+    def _apply_input_filters(self, bus: can.BusABC) -> None:
+        """Let the driver drop Input frames that have no rewrite rule.
+
+        Only used when unmapped frames are not forwarded. Large rule sets are left to
+        the software check in the Input receive handler, as are backends that reject filters.
+        """
+        # Rules match on the ID alone, whatever the frame type, so an ID that fits in
+        # 11 bits is accepted both as a standard and as an extended frame
+        filters: list[dict] = []
+        for can_id in self.rewrite_rules:
+            if can_id <= 0x7FF:
+                filters.append({"can_id": can_id, "can_mask": 0x7FF, "extended": False})
+            filters.append({"can_id": can_id, "can_mask": 0x1FFFFFFF, "extended": True})
+        if not filters or len(filters) > _MAX_HW_FILTERS:
+            return
+        with contextlib.suppress(Exception):
+            bus.set_filters(filters)
+
+    def _bound_buses(self) -> tuple[can.BusABC, can.BusABC]:
+        """Return the open (input, output) buses for binding as loop locals."""
+        assert self.input_bus is not None
+        assert self.output_bus is not None
+        return self.input_bus, self.output_bus
+
+    def _make_selector(
+        self, handle_in: Callable[[float], None], handle_out: Callable[[float], None]
+    ) -> selectors.BaseSelector | None:
+        """Build a selector that wakes on whichever bus becomes readable first.
+
+        ``handle_in``/``handle_out`` are the receive handlers ``run`` built for the
+        current bus open; they are attached to the bus keys as selector data.
+        Returns None when either bus does not expose a pollable file descriptor
+        (most non-SocketCAN backends), in which case ``run`` falls back to polling.
+        """
+        if sys.platform == "win32":
+            # select() only accepts sockets on Windows; driver handles are not pollable
+            return None
+        try:
+            in_bus, out_bus = self._bound_buses()
+            in_fd = in_bus.fileno()
+            out_fd = out_bus.fileno()
+            if not (isinstance(in_fd, int) and isinstance(out_fd, int)):
+                return None
+            if in_fd < 0 or out_fd < 0:
+                return None
+            selector = selectors.DefaultSelector()
+            selector.register(in_fd, selectors.EVENT_READ, handle_in)
+            selector.register(out_fd, selectors.EVENT_READ, handle_out)
+            if self._wake_r is None:
+                wake_r, wake_w = os.pipe()
+                os.set_blocking(wake_r, False)
+                os.set_blocking(wake_w, False)
+                self._wake_r, self._wake_w = wake_r, wake_w
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            return selector
+        except Exception:
+            # NotImplementedError from BusABC.fileno() or an unusable handle
+            return None
+
+    def _close_wake_pipe(self) -> None:
+        """Close the stop() wake pipe, if one was created for the selector."""
+        with self._wake_lock:
+            wake_r, wake_w = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = None
+        for fd in (wake_w, wake_r):
+            if fd is not None:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+
     def _attempt_recovery(self) -> bool:
         """Attempt to recover from a bus-off by reopening buses with retries.
 
@@ -229,49 +753,54 @@ class CANWorker(QObject):
                 self.output_bus.shutdown()
 
         for _ in range(max(0, self._max_retries)):
-            if not self._is_running:
+            # Wait out the retry delay, but give up at once if stop() is called meanwhile
+            if self._stop_event.wait(max(0.0, self._retry_delay)):
                 return False
-            time.sleep(max(0.0, self._retry_delay))
-            if self._open_buses() and hasattr(self.input_bus, "recv") and hasattr(
-                self.output_bus, "send"
-            ):
+            # can.interface.Bus guarantees recv/send; a broken backend fails in the loop
+            if self._open_buses():
                 return True
-                # Otherwise, keep trying
         return False
 
-    def _send_with_retry(self, msg: can.Message) -> bool:
-        """Send a CAN message with timeout and retry/backoff when TX buffer is full.
+    @staticmethod
+    def _send_once(bus: can.BusABC, msg: can.Message, _pacing: _TxPacing) -> bool:
+        """Single send attempt; equivalent to ``_send_with_retry_on`` with throttling off."""
+        try:
+            bus.send(msg, timeout=0.1)
+        except Exception:
+            return False
+        return True
 
-        Returns True if the message was sent, False if dropped after exhausting retries.
+    def _send_with_retry_on(self, bus: can.BusABC, msg: can.Message, pacing: _TxPacing) -> bool:
+        """Send a CAN message to ``bus`` with timeout and retry/backoff when TX buffer is full.
+
+        ``pacing`` is the calling pump's gap state. Returns True if the message was sent,
+        False if dropped after exhausting retries.
         """
-        assert self.output_bus is not None
         # Respect minimum gap between sends to avoid saturating slower backends
-        if self._tx_min_gap > 0.0 and self._last_tx_time > 0.0:
-            now = time.time()
-            elapsed = now - self._last_tx_time
-            remaining = self._tx_min_gap - elapsed
+        monotonic = time.monotonic
+        if pacing.min_gap > 0.0 and pacing.last_tx_time > 0.0:
+            now = monotonic()
+            elapsed = now - pacing.last_tx_time
+            remaining = pacing.min_gap - elapsed
             if remaining > 0:
                 time.sleep(remaining)
 
-        delay = max(0.0, self._send_retry_initial_delay)
-        attempts = max(1, self._max_send_retries)
+        # Both values are clamped once in __init__
+        delay = self._send_retry_initial_delay
+        attempts = self._max_send_retries
         for attempt in range(1, attempts + 1):
             try:
+                t0 = monotonic()
                 # Use a small timeout to allow the backend to wait for TX space
-                self.output_bus.send(msg, timeout=0.1)
+                bus.send(msg, timeout=0.1)
                 # Successful send: record time for inter-send gap
-                self._last_tx_time = time.time()
+                pacing.last_tx_time = now = monotonic()
+                if self._adaptive_tx_gap:
+                    pacing.update(now - t0, now)
                 return True
             except can.CanError as e:
-                text = str(e).lower()
-                # Common patterns across backends for TX queue saturation
-                is_overflow = (
-                    "overflow" in text
-                    or "tx buffer" in text
-                    or "transmit buffer" in text
-                    or "-13" in text
-                )
-                if is_overflow and attempt < attempts and self._is_running:
+                is_overflow = _is_tx_overflow(e)
+                if is_overflow and attempt < attempts and not self._stop_event.is_set():
                     time.sleep(delay)
                     # Exponential backoff but clamp to a reasonable bound
                     delay = min(delay * 2.0, 0.2)
@@ -286,42 +815,6 @@ class CANWorker(QObject):
                 return False
         return False
 
-    def _send_with_retry_on(self, bus: can.BusABC, msg: can.Message) -> bool:
-        """Generalized send retry/backoff to a specific bus (Input or Output)."""
-        # Respect minimum gap globally
-        if self._tx_min_gap > 0.0 and self._last_tx_time > 0.0:
-            now = time.time()
-            elapsed = now - self._last_tx_time
-            remaining = self._tx_min_gap - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-
-        delay = max(0.0, self._send_retry_initial_delay)
-        attempts = max(1, self._max_send_retries)
-        for attempt in range(1, attempts + 1):
-            try:
-                bus.send(msg, timeout=0.1)
-                self._last_tx_time = time.time()
-                return True
-            except can.CanError as e:
-                text = str(e).lower()
-                is_overflow = (
-                    "overflow" in text
-                    or "tx buffer" in text
-                    or "transmit buffer" in text
-                    or "-13" in text
-                )
-                if is_overflow and attempt < attempts and self._is_running:
-                    time.sleep(delay)
-                    delay = min(delay * 2.0, 0.2)
-                    continue
-                if is_overflow and self._tx_overflow_cooldown > 0.0:
-                    time.sleep(self._tx_overflow_cooldown)
-                return False
-            except Exception:
-                return False
-        return False
-
 
 class CANManager(QObject):
     """
@@ -329,9 +822,10 @@ class CANManager(QObject):
     """
 
     channels_detected = pyqtSignal(list)
-    frame_received = pyqtSignal(object, int)  # msg, channel
-    frame_retransmitted = pyqtSignal(object, int)  # msg, channel
+    frames_received_batch = pyqtSignal(list)  # [(msg, channel), ...]
+    frames_retransmitted_batch = pyqtSignal(list)  # [(msg, channel), ...]
     error_occurred = pyqtSignal(str)
+    tx_frames_dropped = pyqtSignal(int)
     # Forwarded worker recovery signals
     recovery_started = pyqtSignal()
     recovery_succeeded = pyqtSignal()
@@ -342,10 +836,46 @@ class CANManager(QObject):
         self._thread: QThread | None = None
         self.worker: CANWorker | None = None
         self._frame_logger: FrameLogger | None = None
-        self._throttle_opts: dict[str, float | int] = {}
+        self._logger_thread: QThread | None = None
+        # Worker threads that did not stop in time, kept alive until they finish
+        self._stalled_threads: list[tuple[QThread, CANWorker | None]] = []
+        self._throttle_opts: dict[str, float | int | bool] = {}
+        # (monotonic time of detection, channel list) from the last detect_channels run
+        self._channel_cache: tuple[float, list[dict[str, str]]] | None = None
+        # Serializes scans, so a request made while one runs is answered from its result
+        self._detect_lock = threading.Lock()
+
+    def detect_channels_async(self, refresh: bool = False) -> None:
+        """Run detect_channels on a background thread.
+
+        channels_detected is then emitted from that thread; slots of QObjects living on
+        the GUI thread receive it through a queued connection, so the caller never blocks
+        on backend enumeration.
+        """
+        threading.Thread(
+            target=self.detect_channels,
+            kwargs={"refresh": refresh},
+            name="CANChannelDetect",
+            daemon=True,
+        ).start()
+
+    def detect_channels(self, refresh: bool = False):
+        """Detects available CAN channels including physical devices.
+
+        Results are cached for a short time so that windows opened in quick
+        succession do not enumerate every backend again; pass ``refresh=True``
+        to force a new scan.
+        """
+        with self._detect_lock:
+            self._detect_channels(refresh)
+
+    def _detect_channels(self, refresh: bool) -> None:
+        now = time.monotonic()
+        cache = self._channel_cache
+        if not refresh and cache is not None and now - cache[0] < _CHANNEL_CACHE_TTL:
+            self.channels_detected.emit(list(cache[1]))
+            return
 
-    def detect_channels(self):
-        """Detects available CAN channels including physical devices."""
         available_channels = []
 
         # Add virtual channels for testing
@@ -356,57 +886,50 @@ class CANManager(QObject):
             ]
         )
 
-        # Detect physical CAN interfaces
-        try:
-            # Detect Kvaser devices
-            available_channels.extend(self._detect_kvaser_devices())
-
-            # Detect other physical interfaces based on platform
-            if platform.system() == "Windows":
-                available_channels.extend(self._detect_windows_can_devices())
-            elif platform.system() == "Linux":
-                available_channels.extend(self._detect_linux_can_devices())
-
-        except Exception:
-            # Keep going even if physical device detection fails
-            pass
-
-        self.channels_detected.emit(available_channels)
+        # Detect physical CAN interfaces; backends are probed concurrently so the
+        # total wait is the slowest backend rather than the sum of all of them
+        detectors = [self._detect_kvaser_devices]
+        if _PLATFORM == "Windows":
+            detectors.append(self._detect_windows_can_devices)
+        elif _PLATFORM == "Linux":
+            detectors.append(self._detect_linux_can_devices)
+
+        with ThreadPoolExecutor(max_workers=len(detectors)) as pool:
+            futures = [pool.submit(detector) for detector in detectors]
+            # Merge in submission order to keep the channel list stable
+            for future in futures:
+                # Keep going even if physical device detection fails
+                with contextlib.suppress(Exception):
+                    available_channels.extend(future.result())
+
+        self._channel_cache = (now, available_channels)
+        self.channels_detected.emit(list(available_channels))
 
     def _detect_kvaser_devices(self) -> list[dict[str, str]]:
-        """Detect Kvaser CAN devices."""
+        """Detect Kvaser CAN devices using canlib's channel enumeration."""
         kvaser_channels: list[dict[str, str]] = []
         try:
-            # Try to import and use Kvaser canlib if available
-            from can.interfaces.kvaser import KvaserBus
-
-            # Kvaser devices typically show up as channel 0, 1, etc.
-            for channel_num in range(8):  # Check up to 8 channels
-                try:
-                    # Try to create a bus to test if the channel exists
-                    test_bus = KvaserBus(channel=channel_num, receive_own_messages=False)
-                    test_bus.shutdown()
-
-                    kvaser_channels.append(
-                        {
-                            "interface": "kvaser",
-                            "channel": str(channel_num),
-                            "display_name": f"Kvaser Channel {channel_num}",
-                        }
-                    )
-                except Exception:
-                    # Channel doesn't exist or can't be opened
-                    continue
-
-        except (ImportError, Exception):
+            # canGetNumberOfChannels lists attached channels without opening them
+            configs = can.detect_available_configs(interfaces=["kvaser"])
+        except Exception:
             # Kvaser library not available or other error
-            pass
+            return kvaser_channels
+
+        for config in configs:
+            channel_num = config["channel"]
+            kvaser_channels.append(
+                {
+                    "interface": "kvaser",
+                    "channel": str(channel_num),
+                    "display_name": f"Kvaser Channel {channel_num}",
+                }
+            )
 
         return kvaser_channels
 
-    def _detect_windows_can_devices(self) -> list[dict[str, str]]:
-        """Detect CAN devices on Windows."""
-        windows_channels: list[dict[str, str]] = []
+    def _detect_windows_can_devices(self) -> list[dict[str, str | int]]:
+        """Detect CAN devices on Windows using the vendor enumeration APIs."""
+        windows_channels: list[dict[str, str | int]] = []
         try:
             # Suppress noisy backend warnings during detection only
             noisy_loggers = [
@@ -420,37 +943,17 @@ class CANManager(QObject):
                 logger.setLevel(logging.ERROR)
 
             try:
-                # Try to detect PCAN devices
+                # PCAN-Basic reports attached channels (PCAN_ATTACHED_CHANNELS)
                 try:
-                    from can.interfaces.pcan import PcanBus
-
-                    # Common PCAN channels
-                    pcan_channels = [
-                        "PCAN_USBBUS1",
-                        "PCAN_USBBUS2",
-                        "PCAN_USBBUS3",
-                        "PCAN_USBBUS4",
-                        "PCAN_USBBUS5",
-                        "PCAN_USBBUS6",
-                        "PCAN_USBBUS7",
-                        "PCAN_USBBUS8",
-                    ]
-
-                    for channel in pcan_channels:
-                        try:
-                            test_bus = PcanBus(channel=channel, bitrate=500000)
-                            test_bus.shutdown()
-
-                            windows_channels.append(
-                                {
-                                    "interface": "pcan",
-                                    "channel": channel,
-                                    "display_name": f"PCAN {channel}",
-                                }
-                            )
-                        except Exception:
-                            continue
-
+                    for config in can.detect_available_configs(interfaces=["pcan"]):
+                        channel = config["channel"]
+                        windows_channels.append(
+                            {
+                                "interface": "pcan",
+                                "channel": channel,
+                                "display_name": f"PCAN {channel}",
+                            }
+                        )
                 except (ImportError, Exception):
                     pass
 
@@ -459,28 +962,26 @@ class CANManager(QObject):
                 try:
                     ctypes.WinDLL("vxlapi64")
                     has_vxl = True
-                except OSError:
+                except (OSError, AttributeError):
                     has_vxl = False
 
                 if has_vxl:
                     try:
-                        from can.interfaces.vector import VectorBus
-
-                        # Vector channels are typically numbered
-                        for channel_num in range(4):
-                            try:
-                                vector_bus = VectorBus(channel=channel_num, bitrate=500000)
-                                vector_bus.shutdown()
-
-                                windows_channels.append(
-                                    {
-                                        "interface": "vector",
-                                        "channel": str(channel_num),
-                                        "display_name": f"Vector Channel {channel_num}",
-                                    }
-                                )
-                            except Exception:
-                                continue
+                        # xlGetDriverConfig lists the CAN-capable channels. "channel" is
+                        # the channel on the device, so serial and the driver's global
+                        # channel_index go into the bus config to select it unambiguously.
+                        for config in can.detect_available_configs(interfaces=["vector"]):
+                            channel_num = config["channel"]
+                            serial = config["serial"]
+                            windows_channels.append(
+                                {
+                                    "interface": "vector",
+                                    "channel": str(channel_num),
+                                    "serial": serial,
+                                    "channel_index": config["channel_index"],
+                                    "display_name": f"Vector {serial} Channel {channel_num}",
+                                }
+                            )
                     except (ImportError, Exception):
                         # python-can vector backend not installed/available
                         pass
@@ -498,32 +999,44 @@ class CANManager(QObject):
         """Detect CAN devices on Linux."""
         linux_channels: list[dict[str, str]] = []
         try:
-            # Check for SocketCAN interfaces
-            import re
-            import subprocess
-
-            # Get network interfaces
-            result = subprocess.run(
-                ["ip", "link", "show"], capture_output=True, text=True, timeout=5
+            can_interfaces = self._list_socketcan_links()
+        except Exception:
+            return linux_channels
+
+        for interface in can_interfaces:
+            linux_channels.append(
+                {
+                    "interface": "socketcan",
+                    "channel": interface,
+                    "display_name": f"SocketCAN {interface}",
+                }
             )
 
-            if result.returncode == 0:
-                # Look for CAN interfaces (can0, can1, etc.)
-                can_interfaces = re.findall(r"\d+:\s+(can\d+):", result.stdout)
-
-                for interface in can_interfaces:
-                    linux_channels.append(
-                        {
-                            "interface": "socketcan",
-                            "channel": interface,
-                            "display_name": f"SocketCAN {interface}",
-                        }
-                    )
+        return linux_channels
 
+    @staticmethod
+    def _list_socketcan_links() -> list[str]:
+        """Return the names of SocketCAN links (link kind ``can``)."""
+        try:
+            # Optional dependency (the "netlink" extra)
+            from pyroute2 import IPRoute
+
+            # Ask the kernel over Netlink (RTM_GETLINK) instead of parsing `ip` output
+            names = []
+            with IPRoute() as ipr:
+                for link in ipr.get_links():
+                    linkinfo = link.get_attr("IFLA_LINKINFO")
+                    if linkinfo is not None and linkinfo.get_attr("IFLA_INFO_KIND") == "can":
+                        names.append(link.get_attr("IFLA_IFNAME"))
+            return names
         except Exception:
+            # pyroute2 is not installed or the Netlink query failed; fall back below
             pass
 
-        return linux_channels
+        import socket
+
+        # Interface names straight from libc; link kinds are unknown here, so match by name
+        return [name for _index, name in socket.if_nameindex() if _CAN_IF_RE.fullmatch(name)]
 
     def start_retransmission(
         self, input_config, output_config, rewrite_rules, log_file: str | None
@@ -536,6 +1049,12 @@ class CANManager(QObject):
             self._frame_logger = FrameLogger()
             self._frame_logger.set_log_path(log_file)
             self._frame_logger.start_logging()
+            if self._frame_logger.is_logging:
+                # Disk writes get their own thread, away from the CAN and GUI threads
+                self._logger_thread = QThread()
+                self._logger_thread.setObjectName("CANLoggerThread")
+                self._frame_logger.moveToThread(self._logger_thread)
+                self._logger_thread.start()
 
         self._thread = QThread()
         self._thread.setObjectName("CANThread")
@@ -549,38 +1068,44 @@ class CANManager(QObject):
             send_retry_initial_delay=float(opts.get("send_retry_initial_delay", 0.01)),
             tx_min_gap=float(opts.get("tx_min_gap", 0.0)),
             tx_overflow_cooldown=float(opts.get("tx_overflow_cooldown", 0.05)),
+            tx_queue_size=int(opts.get("tx_queue_size", 256)),
+            tx_drop_oldest=bool(opts.get("tx_drop_oldest", False)),
+            adaptive_tx_gap=bool(opts.get("adaptive_tx_gap", False)),
+            forward_unmapped=bool(opts.get("forward_unmapped", True)),
         )
         self.worker.moveToThread(self._thread)
 
         # Forward signals from worker to the manager's signals
-        self.worker.frame_received.connect(self.frame_received)
-        self.worker.frame_retransmitted.connect(self.frame_retransmitted)
+        self.worker.frames_received_batch.connect(self.frames_received_batch)
+        self.worker.frames_retransmitted_batch.connect(self.frames_retransmitted_batch)
         self.worker.error_occurred.connect(self.error_occurred)
+        self.worker.tx_frames_dropped.connect(self.tx_frames_dropped)
         # Forward recovery lifecycle
         self.worker.recovery_started.connect(self.recovery_started)
         self.worker.recovery_succeeded.connect(self.recovery_succeeded)
         self.worker.recovery_failed.connect(self.recovery_failed)
 
-        # Connect worker signals to logger if active
+        # Connect worker signals to logger if active; batches are queued to the
+        # logger thread, so all CSV writes happen there in emission order
         if self._frame_logger and self._frame_logger.is_logging:
-            # Create wrapper functions to handle the new signal signature (msg, channel)
-            frame_logger = self._frame_logger  # Local reference for type checker
-            
-            def log_rx_frame(msg, channel):
-                frame_logger.log_frame("RX", msg, channel)
-            
-            def log_tx_frame(msg, channel):
-                frame_logger.log_frame("TX", msg, channel)
-            
-            self.worker.frame_received.connect(log_rx_frame)
-            self.worker.frame_retransmitted.connect(log_tx_frame)
+            queued = Qt.ConnectionType.QueuedConnection
+            self.worker.frames_received_batch.connect(self._frame_logger.log_rx_frames, queued)
+            self.worker.frames_retransmitted_batch.connect(
+                self._frame_logger.log_tx_frames, queued
+            )
 
         self._thread.started.connect(self.worker.run)
         self.worker.finished.connect(self._thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
+        # A worker that ends on its own (open failure, unrecoverable error) must not
+        # leave the log file open until the next Stop
+        self.worker.finished.connect(
+            self._on_worker_finished, Qt.ConnectionType.QueuedConnection
+        )
+        # No deleteLater: the manager owns the thread and worker through its references,
+        # which also keeps the wrappers valid for threads parked in _stalled_threads
 
-        self._thread.start()
+        # Keep frame forwarding ahead of GUI work when the cores are busy
+        self._thread.start(QThread.Priority.HighPriority)
 
     def set_throttle_options(
         self,
@@ -589,6 +1114,10 @@ class CANManager(QObject):
         send_retry_initial_delay: float,
         tx_min_gap: float,
         tx_overflow_cooldown: float,
+        tx_queue_size: int = 256,
+        tx_drop_oldest: bool = False,
+        adaptive_tx_gap: bool = False,
+        forward_unmapped: bool = True,
     ) -> None:
         """Set throttling/backpressure options used when creating the worker."""
         self._throttle_opts = {
@@ -596,20 +1125,76 @@ class CANManager(QObject):
             "send_retry_initial_delay": float(max(0.0, send_retry_initial_delay)),
             "tx_min_gap": float(max(0.0, tx_min_gap)),
             "tx_overflow_cooldown": float(max(0.0, tx_overflow_cooldown)),
+            "tx_queue_size": int(max(1, tx_queue_size)),
+            "tx_drop_oldest": bool(tx_drop_oldest),
+            "adaptive_tx_gap": bool(adaptive_tx_gap),
+            "forward_unmapped": bool(forward_unmapped),
         }
 
+    @staticmethod
+    def _detach_worker(worker: CANWorker) -> None:
+        """Disconnect a stalled worker so its late frames and errors reach no later run."""
+        for signal in (
+            worker.frames_received_batch,
+            worker.frames_retransmitted_batch,
+            worker.error_occurred,
+            worker.tx_frames_dropped,
+            worker.recovery_started,
+            worker.recovery_succeeded,
+            worker.recovery_failed,
+        ):
+            # TypeError: nothing was connected
+            with contextlib.suppress(TypeError):
+                signal.disconnect()
+
     def stop_retransmission(self):
         """Stops the CAN retransmission thread."""
         if self.worker:
             self.worker.stop()
+        self._stalled_threads = [(t, w) for t, w in self._stalled_threads if t.isRunning()]
         if self._thread:
             self._thread.quit()
-            self._thread.wait(2000)  # Wait up to 2 seconds
-            if self._thread.isRunning():
-                self._thread.terminate()
+            # Every wait in the worker is interruptible by stop(), so it normally exits
+            # promptly. A driver call that hangs must not freeze the GUI either, and
+            # terminate() would kill the thread with buses open, so it is left to finish.
+            if not self._thread.wait(_STOP_WAIT_MS):
+                message = (
+                    f"CAN worker did not stop within {_STOP_WAIT_MS / 1000:g} s; "
+                    "the CAN driver is not responding"
+                )
+                _log.error(message)
+                self.error_occurred.emit(message)
+                if self.worker is not None:
+                    self._detach_worker(self.worker)
+                # Destroying a running QThread aborts the process
+                self._stalled_threads.append((self._thread, self.worker))
             self._thread = None
             self.worker = None
 
+        self._stop_logging()
+
+    @pyqtSlot()
+    def _on_worker_finished(self) -> None:
+        """Close the log once the current worker has ended by itself."""
+        # Workers of earlier runs (already stopped or stalled) are ignored
+        if self.worker is not None and self.sender() is self.worker:
+            self._stop_logging()
+
+    def _stop_logging(self) -> None:
+        """Close the log file and end the logger thread, if logging is active."""
         if self._frame_logger:
-            self._frame_logger.stop_logging()
+            logger_thread = self._logger_thread
+            if logger_thread is not None and logger_thread.isRunning():
+                # Close the file on the logger thread once the batches queued before
+                # this call have been written
+                QMetaObject.invokeMethod(
+                    self._frame_logger,
+                    "stop_logging",
+                    Qt.ConnectionType.BlockingQueuedConnection,
+                )
+                logger_thread.quit()
+                logger_thread.wait(2000)
+            else:
+                self._frame_logger.stop_logging()
+            self._logger_thread = None
             self._frame_logger = None
@@ -1,17 +1,39 @@
 """
-This module contains the FrameLogger class for logging CAN frames to a CSV file.
+This module contains the FrameLogger class for logging CAN frames to a CSV or BLF file.
 """
 
-import csv
+import can
+from PyQt6.QtCore import QObject, pyqtSlot
 
+# Rows are formatted directly rather than through csv.writer: every field is a number
+# or a hex string, so nothing needs quoting. csv.writer's line terminator is kept.
+_HEADER = "Timestamp,Channel,Direction,ID,DLC,Data\r\n"
+_ROW_FORMAT = "{:.3f},{},{},{:X},{},{}\r\n"
 
-class FrameLogger:
-    """Logs CAN frames to a CSV file with dual-channel support."""
+# Write buffer of the log file; one batch is formatted into one write() call and the
+# OS only sees a write when this much has accumulated (or on close)
+_LOG_BUFFER_SIZE = 1 << 16
+
+# Log paths with this suffix are written as binary BLF (Vector Binary Logging Format)
+# through python-can instead of CSV: compact records and no text formatting per frame
+_BLF_SUFFIX = ".blf"
+
+
+class FrameLogger(QObject):
+    """Logs CAN frames to a CSV file with dual-channel support.
+
+    A path ending in ``.blf`` selects binary BLF output instead; the channel is stored
+    in each record's channel field and the direction in its RX flag.
+
+    The logger is a QObject so that it can live on its own thread and receive the
+    worker's frame batches through queued connections.
+    """
 
     def __init__(self):
+        super().__init__()
         self._log_file_path: str | None = None
         self._log_file = None
-        self._csv_writer = None
+        self._blf_writer: can.BLFWriter | None = None
         self.is_logging = False
 
     def set_log_path(self, log_file_path: str | None):
@@ -24,15 +46,22 @@ class FrameLogger:
             return
 
         try:
+            if self._log_file_path.lower().endswith(_BLF_SUFFIX):
+                self._blf_writer = can.BLFWriter(self._log_file_path)
+                self.is_logging = True
+                return
             # Use newline='' to prevent blank rows in CSV
             # Note: We need to keep the file open for the duration of logging,
             # so we can't use a context manager here
             self._log_file = open(  # noqa: SIM115
-                self._log_file_path, mode="w", newline="", encoding="utf-8"
+                self._log_file_path,
+                mode="w",
+                newline="",
+                encoding="utf-8",
+                buffering=_LOG_BUFFER_SIZE,
             )
-            self._csv_writer = csv.writer(self._log_file)
             # Write header with channel information
-            self._csv_writer.writerow(["Timestamp", "Channel", "Direction", "ID", "DLC", "Data"])
+            self._log_file.write(_HEADER)
             self.is_logging = True
         except (OSError, PermissionError) as e:
             # In a real GUI app, you'd want to show this error to the user.
@@ -50,20 +79,79 @@ class FrameLogger:
             msg: CAN message object from python-can
             channel: Channel number (0 or 1)
         """
-        if not self.is_logging or not self._csv_writer:
+        self.log_frames(direction, ((msg, channel),))
+
+    def log_frames(self, direction: str, frames):
+        """Logs a batch of CAN frames.
+
+        Args:
+            direction: Direction of the frames ("RX" or "TX")
+            frames: Iterable of (msg, channel) tuples as emitted by the CAN worker
+        """
+        if not self.is_logging:
+            return
+        if self._blf_writer is not None:
+            self._write_blf(direction, frames)
             return
+        if not self._log_file:
+            return
+
+        row = _ROW_FORMAT.format
+        self._log_file.write(
+            "".join(
+                row(
+                    msg.timestamp,
+                    channel,
+                    direction,
+                    msg.arbitration_id,
+                    msg.dlc,
+                    msg.data.hex().upper(),
+                )
+                for msg, channel in frames
+            )
+        )
+
+    def _write_blf(self, direction: str, frames):
+        """Writes a batch as BLF records tagged with their channel and direction."""
+        write = self._blf_writer.on_message_received  # type: ignore[union-attr]
+        is_rx = direction == "RX"
+        for msg, channel in frames:
+            # The frame objects are shared with the GUI, so the tags go on a copy
+            write(
+                can.Message(
+                    timestamp=msg.timestamp,
+                    arbitration_id=msg.arbitration_id,
+                    is_extended_id=msg.is_extended_id,
+                    is_remote_frame=msg.is_remote_frame,
+                    is_error_frame=msg.is_error_frame,
+                    is_fd=msg.is_fd,
+                    bitrate_switch=msg.bitrate_switch,
+                    error_state_indicator=msg.error_state_indicator,
+                    dlc=msg.dlc,
+                    data=msg.data,
+                    channel=channel,
+                    is_rx=is_rx,
+                )
+            )
 
-        timestamp = f"{msg.timestamp:.3f}"
-        can_id = f"{msg.arbitration_id:X}"
-        dlc = msg.dlc
-        data = msg.data.hex().upper()
+    @pyqtSlot(list)
+    def log_rx_frames(self, frames):
+        """Slot for the worker's received-frames batch signal."""
+        self.log_frames("RX", frames)
 
-        self._csv_writer.writerow([timestamp, channel, direction, can_id, dlc, data])
+    @pyqtSlot(list)
+    def log_tx_frames(self, frames):
+        """Slot for the worker's retransmitted-frames batch signal."""
+        self.log_frames("TX", frames)
 
+    @pyqtSlot()
     def stop_logging(self):
         """Closes the log file."""
+        if self.is_logging and self._blf_writer is not None:
+            self._blf_writer.stop()
+            self._blf_writer = None
+            self.is_logging = False
         if self.is_logging and self._log_file:
             self._log_file.close()
             self._log_file = None
-            self._csv_writer = None
             self.is_logging = False
@@ -7,10 +7,12 @@ from __future__ import annotations
 
 import contextlib
 import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt6.QtGui import QCloseEvent, QIcon
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -22,6 +24,7 @@ from PyQt6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
 )
@@ -32,16 +35,104 @@ from .settings_dialog import SettingsDialog
 from .utils import RuleParsingError, get_resource_path, parse_rewrite_rules
 from .version import __version__
 
+# Help > About text; the version is fixed at import time
+_ABOUT_HTML = f"""
+    <h2>CAN ID Reframe Tool</h2>
+    <p>Version: {__version__}</p>
+    <p>This tool allows retransmission of CAN frames between two channels, 
+    with the ability to rewrite IDs on the fly.</p>
+    <hr>
+    <p><b>Safety Warning (REQ-NFR-SAF-002):</b></p>
+    <p>Be aware of possible unintended side effects when 
+    retransmitting and modifying CAN frames on an active bus. This tool is 
+    for diagnostic and development purposes and should not be used to 
+    control safety-critical systems.</p>
+"""
+
+# Each frame table shows the most recent frames only, newest first
+_FRAME_TABLE_ROWS = 100
+
+# The data column starts wide enough for a classic 8-byte payload (16 hex digits) and
+# keeps that width; it is not measured from its contents, which would walk every row on
+# each update. Users can still widen it for CAN FD payloads.
+_DATA_COLUMN_SAMPLE = "F" * 16
+_DATA_COLUMN_PADDING = 16  # pixels
+
+# Keys of a detected channel that select the hardware when opening the bus; Vector
+# channels also carry the device serial and the driver's global channel index
+_BUS_SELECTOR_KEYS = ("interface", "channel", "serial", "channel_index")
+
+
+class FrameTableModel(QAbstractTableModel):
+    """Latest frames of one channel/direction, newest first, capped at _FRAME_TABLE_ROWS.
+
+    Rows hold the python-can messages themselves; cell text is only formatted when a
+    view asks for a visible cell, so adding frames costs no per-cell item objects.
+    """
+
+    HEADERS = ("Timestamp", "ID (Hex)", "DLC", "Data (Hex)")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: deque = deque()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        msg = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return f"{msg.timestamp:.3f}"
+        if column == 1:
+            return f"{msg.arbitration_id:X}"
+        if column == 2:
+            return str(msg.dlc)
+        return msg.data.hex().upper()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def add_frames(self, msgs: list) -> None:
+        """Insert frames given in arrival order; the last one ends up on top."""
+        count = min(len(msgs), _FRAME_TABLE_ROWS)
+        if not count:
+            return
+        rows = self._rows
+        # Trim the oldest rows first so the view sees one removal and one insertion
+        overflow = len(rows) + count - _FRAME_TABLE_ROWS
+        if overflow > 0:
+            first = len(rows) - overflow
+            self.beginRemoveRows(QModelIndex(), first, len(rows) - 1)
+            for _ in range(overflow):
+                rows.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, count - 1)
+        rows.extendleft(msgs[-count:])
+        self.endInsertRows()
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
     # Hints for linters to know the attributes injected by loadUi
     # Note: Connection, logging, and throttling controls are now in settings dialog
-    frames_table_RX_Channel0: QTableWidget
-    frames_table_TX_Channel0: QTableWidget
-    frames_table_RX_Channel1: QTableWidget
-    frames_table_TX_Channel1: QTableWidget
+    frames_table_RX_Channel0: QTableView
+    frames_table_TX_Channel0: QTableView
+    frames_table_RX_Channel1: QTableView
+    frames_table_TX_Channel1: QTableView
     mapping_table: QTableWidget
     add_rule_button: QPushButton
     delete_rule_button: QPushButton
@@ -86,6 +177,10 @@ class MainWindow(QMainWindow):
 
         self.can_manager = CANManager()
         self.is_running = False
+        # Colour currently applied to the status indicator
+        self._status_color: str | None = None
+        # Frames dropped during the current run (drop-oldest evictions and failed sends)
+        self._tx_dropped_total = 0
         self.settings_dialog: SettingsDialog | None = None
         self._channels: list[dict[str, Any]] = []
         
@@ -103,6 +198,7 @@ class MainWindow(QMainWindow):
                 "input_channel_index": 0,
                 "output_channel_index": 1,
                 "bitrate": "500",
+                "forward_unmapped": True,
             },
             "logging": {
                 "log_file_path": default_log_path,
@@ -111,24 +207,32 @@ class MainWindow(QMainWindow):
                 "max_send_retries": "10",
                 "send_retry_initial_delay": "0.01",
                 "tx_min_gap": "0.0",
+                "adaptive_tx_gap": False,
                 "tx_overflow_cooldown": "0.05",
+                "tx_queue_size": "256",
+                "tx_drop_oldest": False,
             },
         }
 
         self._configure_widgets()
         self._connect_signals()
-        self.update_status("Disconnected", "grey")
-        self.can_manager.detect_channels()
+        # Channels are listed in the background so the window shows up immediately
+        self.update_status("Detecting channels…", "grey")
+        self.can_manager.detect_channels_async()
 
     # ------------------------------------------------------------------
     # Initial widget configuration
     # ------------------------------------------------------------------
     def _configure_widgets(self) -> None:
-        # Frame tables configuration for both channels
-        self._configure_frame_table(self.frames_table_RX_Channel0)
-        self._configure_frame_table(self.frames_table_TX_Channel0)
-        self._configure_frame_table(self.frames_table_RX_Channel1)
-        self._configure_frame_table(self.frames_table_TX_Channel1)
+        # Frame tables configuration for both channels, indexed by channel number
+        self._rx_frame_models = (
+            self._configure_frame_table(self.frames_table_RX_Channel0),
+            self._configure_frame_table(self.frames_table_RX_Channel1),
+        )
+        self._tx_frame_models = (
+            self._configure_frame_table(self.frames_table_TX_Channel0),
+            self._configure_frame_table(self.frames_table_TX_Channel1),
+        )
 
         # Mapping table
         self.mapping_table.setColumnCount(2)
@@ -177,25 +281,36 @@ class MainWindow(QMainWindow):
                 with contextlib.suppress(Exception):
                     getattr(self, _name).setVisible(False)
 
-    def _configure_frame_table(self, table: QTableWidget) -> None:
-        """Configure a frame table with standard settings."""
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels(["Timestamp", "ID (Hex)", "DLC", "Data (Hex)"])
+    def _configure_frame_table(self, table: QTableView) -> FrameTableModel:
+        """Attach a frame model to a table view and configure it with standard settings."""
+        model = FrameTableModel(table)
+        table.setModel(model)
         table.setEditTriggers(table.EditTrigger.NoEditTriggers)
         header = table.horizontalHeader()
         if header is not None:  # Defense against static analysis
             header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
+            metrics = table.fontMetrics()
+            header.resizeSection(
+                3,
+                max(
+                    metrics.horizontalAdvance(_DATA_COLUMN_SAMPLE),
+                    metrics.horizontalAdvance(FrameTableModel.HEADERS[3]),
+                )
+                + _DATA_COLUMN_PADDING,
+            )
+        return model
 
     # ------------------------------------------------------------------
     # Signal connections
     # ------------------------------------------------------------------
     def _connect_signals(self) -> None:
         self.can_manager.error_occurred.connect(self._handle_error)
+        self.can_manager.tx_frames_dropped.connect(self._on_tx_frames_dropped)
         self.can_manager.channels_detected.connect(self._populate_channel_selectors)
-        # Connect frame signals directly now that they include channel information
-        self.can_manager.frame_received.connect(self._add_received_frame_to_view)
-        self.can_manager.frame_retransmitted.connect(self._add_transmitted_frame_to_view)
+        # Frames arrive in batches of (msg, channel) tuples
+        self.can_manager.frames_received_batch.connect(self._add_received_frames_to_view)
+        self.can_manager.frames_retransmitted_batch.connect(self._add_transmitted_frames_to_view)
         # Recovery lifecycle to inform user about reconnect attempts
         self.can_manager.recovery_started.connect(
             lambda: self.update_status("Reconnecting…", "orange")
@@ -239,13 +354,21 @@ class MainWindow(QMainWindow):
             self.output_channel_combo.addItem(display_name, userData=ch)
         if self.output_channel_combo.count() > 1:
             self.output_channel_combo.setCurrentIndex(1)
+        if not self.is_running:
+            self.update_status("Disconnected", "grey")
 
     # ------------------------------------------------------------------
     # UI utilities
     # ------------------------------------------------------------------
     def update_status(self, message: str, color: str) -> None:
         self.status_label.setText(message)
-        self.status_indicator.setStyleSheet(f"background-color: {color}; border-radius: 10px;")
+        # setStyleSheet re-parses and re-polishes even for identical CSS; drop-count and
+        # recovery updates mostly keep the colour, so only apply a change
+        if color != self._status_color:
+            self._status_color = color
+            self.status_indicator.setStyleSheet(
+                f"background-color: {color}; border-radius: 10px;"
+            )
 
     def _set_default_log_path(self) -> None:
         """Populate the log file path edit with a sensible default in CWD/LOGS.
@@ -265,7 +388,7 @@ class MainWindow(QMainWindow):
 
     def _on_browse_log_file(self) -> None:
         filename, _ = QFileDialog.getSaveFileName(
-            self, "Save Log As", "", "CSV files (*.csv);;All files (*)"
+            self, "Save Log As", "", "CSV files (*.csv);;BLF files (*.blf);;All files (*)"
         )
         if filename:
             self.log_file_path_edit.setText(filename)
@@ -273,31 +396,24 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Frame reception and transmission
     # ------------------------------------------------------------------
-    def _add_received_frame_to_view(self, msg, channel: int) -> None:  # msg comes from python-can
-        """Add a received CAN frame to the appropriate RX table based on channel."""
-        if channel == 0:
-            self._add_frame_to_table(self.frames_table_RX_Channel0, msg)
-        else:  # channel == 1
-            self._add_frame_to_table(self.frames_table_RX_Channel1, msg)
-
-    def _add_transmitted_frame_to_view(self, msg, channel: int) -> None:
-        """Add a transmitted CAN frame to the appropriate TX table based on channel."""
-        if channel == 0:
-            self._add_frame_to_table(self.frames_table_TX_Channel0, msg)
-        else:  # channel == 1
-            self._add_frame_to_table(self.frames_table_TX_Channel1, msg)
-
-    def _add_frame_to_table(self, table: QTableWidget, msg) -> None:
-        """Add a CAN frame to the specified table."""
+    def _add_received_frames_to_view(self, frames: list) -> None:
+        """Add a batch of received (msg, channel) frames to the RX tables."""
+        self._add_frames_to_models(self._rx_frame_models, frames)
+
+    def _add_transmitted_frames_to_view(self, frames: list) -> None:
+        """Add a batch of transmitted (msg, channel) frames to the TX tables."""
+        self._add_frames_to_models(self._tx_frame_models, frames)
+
+    def _add_frames_to_models(self, models: tuple, frames: list) -> None:
+        """Split a batch by channel and hand each table its frames in one update."""
         if not self.is_running:
             return
-        table.insertRow(0)
-        table.setItem(0, 0, QTableWidgetItem(f"{msg.timestamp:.3f}"))
-        table.setItem(0, 1, QTableWidgetItem(f"{msg.arbitration_id:X}"))
-        table.setItem(0, 2, QTableWidgetItem(str(msg.dlc)))
-        table.setItem(0, 3, QTableWidgetItem(msg.data.hex().upper()))
-        if table.rowCount() > 100:
-            table.removeRow(100)
+        per_channel: tuple[list, list] = ([], [])
+        for msg, channel in frames:
+            # Channel 0 is the output bus; anything else is the input bus
+            per_channel[1 if channel else 0].append(msg)
+        for model, msgs in zip(models, per_channel, strict=True):
+            model.add_frames(msgs)
 
     # ------------------------------------------------------------------
     # Rewrite rules
@@ -481,8 +597,10 @@ class MainWindow(QMainWindow):
 
         input_data: dict[str, Any] = channels[input_index]
         output_data: dict[str, Any] = channels[output_index]
+        input_cfg = {k: input_data[k] for k in _BUS_SELECTOR_KEYS if k in input_data}
+        output_cfg = {k: output_data[k] for k in _BUS_SELECTOR_KEYS if k in output_data}
 
-        if input_data["channel"] == output_data["channel"]:
+        if input_cfg == output_cfg:
             self._show_error_message(
                 "Configuration Error", "Input and output channel cannot be the same."
             )
@@ -504,16 +622,8 @@ class MainWindow(QMainWindow):
 
         log_file = self.current_settings["logging"]["log_file_path"] or None
 
-        input_cfg = {
-            "interface": input_data["interface"],
-            "channel": input_data["channel"],
-            "bitrate": bitrate,
-        }
-        output_cfg = {
-            "interface": output_data["interface"],
-            "channel": output_data["channel"],
-            "bitrate": bitrate,
-        }
+        input_cfg["bitrate"] = bitrate
+        output_cfg["bitrate"] = bitrate
         
         # Apply throttle options from settings
         def _get_float(value: str, default: float) -> float:
@@ -538,13 +648,24 @@ class MainWindow(QMainWindow):
             self.current_settings["throttling"]["tx_overflow_cooldown"], 0.05
         )
 
+        # Settings files saved before these options existed do not have the keys
+        tx_queue_size = _get_int(self.current_settings["throttling"].get("tx_queue_size", ""), 256)
+        tx_drop_oldest = bool(self.current_settings["throttling"].get("tx_drop_oldest", False))
+        adaptive_tx_gap = bool(self.current_settings["throttling"].get("adaptive_tx_gap", False))
+        forward_unmapped = bool(self.current_settings["connection"].get("forward_unmapped", True))
+
         self.can_manager.set_throttle_options(
             max_send_retries=max_send_retries,
             send_retry_initial_delay=send_retry_initial_delay,
             tx_min_gap=tx_min_gap,
             tx_overflow_cooldown=tx_overflow_cooldown,
+            tx_queue_size=tx_queue_size,
+            tx_drop_oldest=tx_drop_oldest,
+            adaptive_tx_gap=adaptive_tx_gap,
+            forward_unmapped=forward_unmapped,
         )
 
+        self._tx_dropped_total = 0
         self.can_manager.start_retransmission(input_cfg, output_cfg, rewrite_rules, log_file)
         self.update_status("Retransmitting", "green")
         self.start_stop_button.setText("Stop")
@@ -554,6 +675,14 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Errors / dialogs
     # ------------------------------------------------------------------
+    def _on_tx_frames_dropped(self, count: int) -> None:
+        """Show frames dropped under overload in the status line; the run continues."""
+        self._tx_dropped_total += count
+        if self.is_running:
+            self.update_status(
+                f"Retransmitting ({self._tx_dropped_total} frames dropped)", "orange"
+            )
+
     def _handle_error(self, error_message: str) -> None:
         self._show_error_message("Error", error_message)
         if self.is_running:
@@ -570,19 +699,7 @@ class MainWindow(QMainWindow):
         msg_box.exec()
 
     def _show_about_dialog(self) -> None:
-        about_text = f"""
-            <h2>CAN ID Reframe Tool</h2>
-            <p>Version: {__version__}</p>
-            <p>This tool allows retransmission of CAN frames between two channels, 
-            with the ability to rewrite IDs on the fly.</p>
-            <hr>
-            <p><b>Safety Warning (REQ-NFR-SAF-002):</b></p>
-            <p>Be aware of possible unintended side effects when 
-            retransmitting and modifying CAN frames on an active bus. This tool is 
-            for diagnostic and development purposes and should not be used to 
-            control safety-critical systems.</p>
-        """
-        QMessageBox.about(self, "About CAN ID Reframe Tool", about_text)
+        QMessageBox.about(self, "About CAN ID Reframe Tool", _ABOUT_HTML)
 
     # ------------------------------------------------------------------
     # Menu action handlers
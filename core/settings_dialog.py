@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -37,7 +38,9 @@ class SettingsDialog(QDialog):
     # Connection tab
     input_channel_combo: QComboBox
     output_channel_combo: QComboBox
+    rescan_channels_button: QPushButton
     bitrate_combo: QComboBox
+    forward_unmapped_check: QCheckBox
     # Logging tab
     log_file_path_edit: QLineEdit
     browse_log_file_button: QPushButton
@@ -45,7 +48,10 @@ class SettingsDialog(QDialog):
     max_send_retries_edit: QLineEdit
     send_retry_initial_delay_edit: QLineEdit
     tx_min_gap_edit: QLineEdit
+    adaptive_tx_gap_check: QCheckBox
     tx_overflow_cooldown_edit: QLineEdit
+    tx_queue_size_edit: QLineEdit
+    tx_drop_oldest_check: QCheckBox
     reset_defaults_button: QPushButton
     # Dialog buttons
     buttonBox: QDialogButtonBox
@@ -59,6 +65,8 @@ class SettingsDialog(QDialog):
 
         self.can_manager = can_manager
         self._channels: list[dict[str, Any]] = []
+        # Channel selection requested by set_settings(); applied when the list arrives
+        self._requested_channel_indices = (0, 1)
 
         # Expose the tab widget under the name expected by tests
         # Prefer an existing widget named in the UI, otherwise find or create one.
@@ -78,15 +86,19 @@ class SettingsDialog(QDialog):
         self._connect_signals()
         self._set_default_values()
 
-        # Populate channels if manager is available
+        # Populate channels if manager is available; detection runs off the GUI thread
+        # and is normally answered from the main window's startup scan
         if self.can_manager:
             self.can_manager.channels_detected.connect(self._populate_channel_selectors)
-            self.can_manager.detect_channels()
+            self.can_manager.detect_channels_async()
+        else:
+            self.rescan_channels_button.setEnabled(False)
 
     def _connect_signals(self) -> None:
         """Connect widget signals to handlers."""
         self.browse_log_file_button.clicked.connect(self._on_browse_log_file)
         self.reset_defaults_button.clicked.connect(self._reset_throttling_defaults)
+        self.rescan_channels_button.clicked.connect(self._on_rescan_channels)
         
         # Handle Apply button separately
         self.buttonBox.clicked.connect(self._on_button_clicked)
@@ -102,6 +114,7 @@ class SettingsDialog(QDialog):
         idx = self.bitrate_combo.findText("500")
         if idx >= 0:
             self.bitrate_combo.setCurrentIndex(idx)
+        self.forward_unmapped_check.setChecked(True)
 
         # Default log file path with timestamp
         self._set_default_log_path()
@@ -114,7 +127,10 @@ class SettingsDialog(QDialog):
         self.max_send_retries_edit.setText("10")
         self.send_retry_initial_delay_edit.setText("0.01")
         self.tx_min_gap_edit.setText("0.0")
+        self.adaptive_tx_gap_check.setChecked(False)
         self.tx_overflow_cooldown_edit.setText("0.05")
+        self.tx_queue_size_edit.setText("256")
+        self.tx_drop_oldest_check.setChecked(False)
 
     def _set_default_log_path(self) -> None:
         """Set default log file path with timestamp."""
@@ -130,8 +146,19 @@ class SettingsDialog(QDialog):
         
         self.log_file_path_edit.setText(str(logs_dir / default_name))
 
+    def _on_rescan_channels(self) -> None:
+        """Scan for adapters again, bypassing the detection cache."""
+        if self.can_manager:
+            self.rescan_channels_button.setEnabled(False)
+            self.can_manager.detect_channels_async(refresh=True)
+
     def _populate_channel_selectors(self, channels) -> None:
-        """Populate channel combo boxes with detected channels."""
+        """Populate channel combo boxes with detected channels.
+
+        The list arrives asynchronously, possibly after set_settings(). Channels shown
+        before a rescan stay selected; otherwise the requested indices are applied.
+        """
+        previous = (self.input_channel_combo.currentData(), self.output_channel_combo.currentData())
         self._channels = channels
         self.input_channel_combo.clear()
         self.output_channel_combo.clear()
@@ -140,14 +167,20 @@ class SettingsDialog(QDialog):
             display_name = ch.get("display_name", f"{ch['interface']}:{ch['channel']}")
             self.input_channel_combo.addItem(display_name, userData=ch)
             self.output_channel_combo.addItem(display_name, userData=ch)
-        
-        if len(channels) > 1:
-            self.output_channel_combo.setCurrentIndex(1)
+
+        combos = (self.input_channel_combo, self.output_channel_combo)
+        requested = self._requested_channel_indices
+        for combo, selected, index in zip(combos, previous, requested, strict=True):
+            if selected in channels:
+                index = channels.index(selected)
+            if 0 <= index < combo.count():
+                combo.setCurrentIndex(index)
+        self.rescan_channels_button.setEnabled(self.can_manager is not None)
 
     def _on_browse_log_file(self) -> None:
         """Open file dialog to select log file path."""
         fileName, _ = QFileDialog.getSaveFileName(
-            self, "Save Log As", "", "CSV files (*.csv);;All files (*)"
+            self, "Save Log As", "", "CSV files (*.csv);;BLF files (*.blf);;All files (*)"
         )
         if fileName:
             self.log_file_path_edit.setText(fileName)
@@ -157,13 +190,20 @@ class SettingsDialog(QDialog):
         # This will be connected to the main window to apply settings
         pass
 
+    def _channel_index(self, combo: QComboBox, which: int) -> int:
+        """Selected index, or the requested one while the channel list has not arrived."""
+        if combo.count():
+            return combo.currentIndex()
+        return self._requested_channel_indices[which]
+
     def get_settings(self) -> dict[str, Any]:
         """Get current settings as a dictionary."""
         return {
             "connection": {
-                "input_channel_index": self.input_channel_combo.currentIndex(),
-                "output_channel_index": self.output_channel_combo.currentIndex(),
+                "input_channel_index": self._channel_index(self.input_channel_combo, 0),
+                "output_channel_index": self._channel_index(self.output_channel_combo, 1),
                 "bitrate": self.bitrate_combo.currentText(),
+                "forward_unmapped": self.forward_unmapped_check.isChecked(),
             },
             "logging": {
                 "log_file_path": self.log_file_path_edit.text(),
@@ -172,7 +212,10 @@ class SettingsDialog(QDialog):
                 "max_send_retries": self.max_send_retries_edit.text(),
                 "send_retry_initial_delay": self.send_retry_initial_delay_edit.text(),
                 "tx_min_gap": self.tx_min_gap_edit.text(),
+                "adaptive_tx_gap": self.adaptive_tx_gap_check.isChecked(),
                 "tx_overflow_cooldown": self.tx_overflow_cooldown_edit.text(),
+                "tx_queue_size": self.tx_queue_size_edit.text(),
+                "tx_drop_oldest": self.tx_drop_oldest_check.isChecked(),
             },
         }
 
@@ -182,6 +225,10 @@ class SettingsDialog(QDialog):
             # Connection settings
             if "connection" in settings:
                 conn = settings["connection"]
+                self._requested_channel_indices = (
+                    conn.get("input_channel_index", self._requested_channel_indices[0]),
+                    conn.get("output_channel_index", self._requested_channel_indices[1]),
+                )
                 if (
                     "input_channel_index" in conn
                     and conn["input_channel_index"] < self.input_channel_combo.count()
@@ -196,6 +243,8 @@ class SettingsDialog(QDialog):
                     idx = self.bitrate_combo.findText(str(conn["bitrate"]))
                     if idx >= 0:
                         self.bitrate_combo.setCurrentIndex(idx)
+                if "forward_unmapped" in conn:
+                    self.forward_unmapped_check.setChecked(bool(conn["forward_unmapped"]))
 
             # Logging settings
             if "logging" in settings:
@@ -212,8 +261,14 @@ class SettingsDialog(QDialog):
                     self.send_retry_initial_delay_edit.setText(str(throttle["send_retry_initial_delay"]))
                 if "tx_min_gap" in throttle:
                     self.tx_min_gap_edit.setText(str(throttle["tx_min_gap"]))
+                if "adaptive_tx_gap" in throttle:
+                    self.adaptive_tx_gap_check.setChecked(bool(throttle["adaptive_tx_gap"]))
                 if "tx_overflow_cooldown" in throttle:
                     self.tx_overflow_cooldown_edit.setText(str(throttle["tx_overflow_cooldown"]))
+                if "tx_queue_size" in throttle:
+                    self.tx_queue_size_edit.setText(str(throttle["tx_queue_size"]))
+                if "tx_drop_oldest" in throttle:
+                    self.tx_drop_oldest_check.setChecked(bool(throttle["tx_drop_oldest"]))
 
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Error loading settings: {e}")
@@ -117,6 +117,76 @@ def test_retransmission_stops_when_worker_is_stopped(virtual_can_buses):
     assert second_msg is None
 
 
+def test_manager_stop_waits_for_worker_without_terminate(qapp, monkeypatch):
+    """stop_retransmission lets the worker thread finish on its own; it is never terminated."""
+    from PyQt6.QtCore import QThread
+
+    from core.can_logic import CANManager
+
+    terminated = []
+    monkeypatch.setattr(QThread, "terminate", lambda self: terminated.append(self))
+
+    manager = CANManager()
+    manager.start_retransmission(
+        {"interface": "virtual", "channel": "stop_in"},
+        {"interface": "virtual", "channel": "stop_out"},
+        {},
+        None,
+    )
+    thread = manager._thread
+    assert thread is not None
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    manager.stop_retransmission()
+
+    assert not thread.isRunning()
+    assert time.monotonic() - started < 1.0
+    assert terminated == []
+
+
+def test_manager_stop_gives_up_on_hung_worker(qapp, monkeypatch):
+    """A worker stuck in a driver call is reported instead of blocking the caller forever."""
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    from core.can_logic import CANManager
+
+    release = threading.Event()
+
+    def hung_run(self):
+        release.wait(5.0)  # a driver call that ignores the stop request
+        self.error_occurred.emit("late error")
+        self.finished.emit()
+
+    monkeypatch.setattr(CANWorker, "run", hung_run)
+    monkeypatch.setattr("core.can_logic._STOP_WAIT_MS", 50)
+    manager = CANManager()
+    errors: list[str] = []
+    manager.error_occurred.connect(errors.append, type=Qt.ConnectionType.DirectConnection)
+    manager.start_retransmission({}, {}, {}, None)
+    thread = manager._thread
+    assert thread is not None
+
+    try:
+        manager.stop_retransmission()
+
+        assert manager._thread is None
+        assert thread.isRunning()
+        assert errors and "did not stop" in errors[0]
+    finally:
+        release.set()
+        thread.wait()
+
+    # The stalled worker was cut off from the manager, and once its thread has finished
+    # the next stop forgets it without touching a deleted object
+    loop = QEventLoop()
+    QTimer.singleShot(50, loop.quit)
+    loop.exec()  # delivers queued signals and deferred deletes
+    manager.stop_retransmission()
+    assert manager._stalled_threads == []
+    assert "late error" not in errors
+
+
 def test_worker_handles_bus_creation_error():
     """
     Verify that the worker handles an error during bus creation gracefully.
@@ -145,7 +215,7 @@ def test_worker_handles_bus_creation_error():
 
 def test_signals_are_emitted_for_frames(virtual_can_buses):
     """
-    Verify that frame_received and frame_retransmitted signals are emitted.
+    Verify that received and retransmitted frames are reported through the batch signals.
     Covers: REQ-FUNC-LOG-003
     """
     input_bus, _ = virtual_can_buses
@@ -158,18 +228,19 @@ def test_signals_are_emitted_for_frames(virtual_can_buses):
     received_event = threading.Event()
     retransmitted_event = threading.Event()
 
-    def on_receive(msg):
-        received_frames.append(msg)
+    def on_receive(frames):
+        received_frames.extend(frames)
         received_event.set()
 
-    def on_retransmit(msg):
-        retransmitted_frames.append(msg)
+    def on_retransmit(frames):
+        retransmitted_frames.extend(frames)
         retransmitted_event.set()
 
-    # Signals are emitted only for frames matching rewrite rules; use identity mapping
     worker = CANWorker(input_config, output_config, {0x123: 0x123})
-    worker.frame_received.connect(on_receive, type=Qt.ConnectionType.DirectConnection)
-    worker.frame_retransmitted.connect(on_retransmit, type=Qt.ConnectionType.DirectConnection)
+    worker.frames_received_batch.connect(on_receive, type=Qt.ConnectionType.DirectConnection)
+    worker.frames_retransmitted_batch.connect(
+        on_retransmit, type=Qt.ConnectionType.DirectConnection
+    )
 
     worker_thread = threading.Thread(target=worker.run, daemon=True)
     worker_thread.start()
@@ -178,16 +249,18 @@ def test_signals_are_emitted_for_frames(virtual_can_buses):
     msg_to_send = can.Message(arbitration_id=0x123, data=[1])
     input_bus.send(msg_to_send)
 
-    assert received_event.wait(timeout=2.0), "frame_received signal timed out"
-    assert retransmitted_event.wait(timeout=2.0), "frame_retransmitted signal timed out"
+    assert received_event.wait(timeout=2.0), "frames_received_batch signal timed out"
+    assert retransmitted_event.wait(timeout=2.0), "frames_retransmitted_batch signal timed out"
 
     worker.stop()
     worker_thread.join(timeout=1.0)
 
     assert len(received_frames) == 1
-    assert received_frames[0].arbitration_id == 0x123
+    rx_msg, rx_channel = received_frames[0]
+    assert rx_msg.arbitration_id == 0x123 and rx_channel == 1
     assert len(retransmitted_frames) == 1
-    assert retransmitted_frames[0].arbitration_id == 0x123
+    tx_msg, tx_channel = retransmitted_frames[0]
+    assert tx_msg.arbitration_id == 0x123 and tx_channel == 0
 
 
 def test_continuous_monitoring_receives_multiple_frames(virtual_can_buses):
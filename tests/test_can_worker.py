@@ -3,18 +3,26 @@
 Covers:
 - Reverse relay Output->Input is silent (no UI/log signals emitted)
 - Retry/backoff/cooldown timing logic on overflow errors
+- Single select() wait over both buses when they expose a file descriptor
+- Draining of already-queued frames per receive wakeup
+- Failed sends counted as dropped frames without interrupting the relay
 """
 
 from __future__ import annotations
 
+import errno
+import socket
+import sys
 import threading
 import time as _time
 from collections.abc import Callable
 from typing import cast
 
 import can
+import pytest
+from PyQt6.QtCore import Qt
 
-from core.can_logic import CANWorker
+from core.can_logic import CANWorker, _is_tx_overflow
 
 
 class FakeBus:
@@ -42,14 +50,54 @@ class FakeBus:
         pass
 
 
+class PollableFakeBus(FakeBus):
+    """Fake bus exposing a real file descriptor that becomes readable on push()."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._r, self._w = socket.socketpair()
+        self._r.setblocking(False)
+
+    def push(self, msg: can.Message) -> None:
+        self._in_q.append(msg)
+        self._w.send(b"\x00")
+
+    def fileno(self) -> int:
+        return self._r.fileno()
+
+    def recv(self, timeout: float | None = None) -> can.Message | None:  # noqa: ARG002
+        try:
+            self._r.recv(1)
+        except BlockingIOError:
+            return None
+        return super().recv()
+
+    def shutdown(self):
+        self._r.close()
+        self._w.close()
+
+
 def _run_worker_in_thread(worker: CANWorker):
     th = threading.Thread(target=worker.run, daemon=True)
     th.start()
     return th
 
 
-def test_reverse_relay_output_to_input_is_silent(qapp, monkeypatch):
-    """Output->Input relay should forward frames without emitting RX/TX signals."""
+def _relay(monkeypatch, worker: CANWorker, in_bus: FakeBus, out_bus: FakeBus, expected: int):
+    """Run the worker on fake buses until ``expected`` frames reached the output bus."""
+    worker.input_bus = cast(can.BusABC, in_bus)
+    worker.output_bus = cast(can.BusABC, out_bus)
+    monkeypatch.setattr(worker, "_open_buses", lambda: True)
+    th = _run_worker_in_thread(worker)
+    deadline = _time.time() + 1.0
+    while _time.time() < deadline and len(out_bus.sent) < expected:
+        _time.sleep(0.01)
+    worker.stop()
+    th.join(timeout=1.0)
+
+
+def test_reverse_relay_output_to_input_passthrough(qapp, monkeypatch):
+    """Output->Input relay forwards frames unchanged and reports them as Ch0 RX / Ch1 TX."""
     # Prepare a message on the Output bus
     msg = can.Message(arbitration_id=0x123, data=bytes([1, 2, 3]), is_extended_id=False)
     out_bus = FakeBus(recv_queue=[msg])
@@ -67,8 +115,9 @@ def test_reverse_relay_output_to_input_is_silent(qapp, monkeypatch):
     # Capture signals
     received = []
     retransmitted = []
-    worker.frame_received.connect(lambda m: received.append(m))
-    worker.frame_retransmitted.connect(lambda m: retransmitted.append(m))
+    direct = Qt.ConnectionType.DirectConnection
+    worker.frames_received_batch.connect(received.extend, type=direct)
+    worker.frames_retransmitted_batch.connect(retransmitted.extend, type=direct)
 
     th = _run_worker_in_thread(worker)
 
@@ -85,9 +134,9 @@ def test_reverse_relay_output_to_input_is_silent(qapp, monkeypatch):
     assert in_bus.sent[0].arbitration_id == 0x123
     assert bytes(in_bus.sent[0].data) == bytes([1, 2, 3])
 
-    # No UI/log signals should have been emitted for reverse relay
-    assert not received
-    assert not retransmitted
+    # Reverse relay is reported on the output channel's RX and the input channel's TX
+    assert [(m.arbitration_id, ch) for m, ch in received] == [(0x123, 0)]
+    assert [(m.arbitration_id, ch) for m, ch in retransmitted] == [(0x123, 1)]
 
 
 def test_retry_backoff_eventually_succeeds(monkeypatch):
@@ -115,7 +164,7 @@ def test_retry_backoff_eventually_succeeds(monkeypatch):
     )
 
     msg = can.Message(arbitration_id=0x1, data=b"\x01", is_extended_id=False)
-    ok = worker._send_with_retry_on(cast(can.BusABC, bus), msg)
+    ok = worker._send_with_retry_on(cast(can.BusABC, bus), msg, worker._tx_pacing[0])
     assert ok is True
     # Expect at least two backoff sleeps: 0.01 and 0.02 (exponential)
     assert sleeps[:2] == [0.01, 0.02]
@@ -141,7 +190,381 @@ def test_retry_exhausts_and_cooldown(monkeypatch):
     )
 
     msg = can.Message(arbitration_id=0x2, data=b"\x02", is_extended_id=False)
-    ok = worker._send_with_retry_on(cast(can.BusABC, bus), msg)
+    ok = worker._send_with_retry_on(cast(can.BusABC, bus), msg, worker._tx_pacing[0])
     assert ok is False
     # Cooldown should be applied at the end
     assert 0.05 in sleeps
+
+
+def test_send_fast_path_only_without_throttling():
+    """A plain single send is used only when gap, retries, cooldown and adaptation are off."""
+    fast = CANWorker(
+        input_config={},
+        output_config={},
+        rewrite_rules={},
+        max_send_retries=1,
+        tx_overflow_cooldown=0.0,
+    )
+    assert fast._send_frame == fast._send_once
+    default = CANWorker(input_config={}, output_config={}, rewrite_rules={})
+    assert default._send_frame == default._send_with_retry_on
+
+    def overflow(_msg):
+        raise can.CanError("Transmit buffer overflow -13")
+
+    msg = can.Message(arbitration_id=0x1, is_extended_id=False)
+    pacing = fast._tx_pacing[0]
+    assert not fast._send_frame(cast(can.BusABC, FakeBus(send_behavior=overflow)), msg, pacing)
+    ok_bus = FakeBus()
+    assert fast._send_frame(cast(can.BusABC, ok_bus), msg, pacing)
+    assert ok_bus.sent == [msg]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="select() needs sockets on Windows")
+def test_select_wakes_on_first_ready_bus(monkeypatch):
+    """With pollable buses, the worker waits on both at once and relays both directions."""
+    in_bus = PollableFakeBus()
+    out_bus = PollableFakeBus()
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={0x100: 0x200})
+    worker.input_bus = cast(can.BusABC, in_bus)
+    worker.output_bus = cast(can.BusABC, out_bus)
+    monkeypatch.setattr(worker, "_open_buses", lambda: True)
+    built = []
+    make_rx_handlers = worker._make_rx_handlers
+
+    def counting_make_rx_handlers():
+        built.append(True)
+        return make_rx_handlers()
+
+    monkeypatch.setattr(worker, "_make_rx_handlers", counting_make_rx_handlers)
+
+    selector = worker._make_selector(*make_rx_handlers())
+    assert selector is not None
+    selector.close()
+
+    th = _run_worker_in_thread(worker)
+    in_bus.push(can.Message(arbitration_id=0x100, data=b"\x01", is_extended_id=False))
+    out_bus.push(can.Message(arbitration_id=0x300, data=b"\x02", is_extended_id=False))
+
+    deadline = _time.time() + 1.0
+    while _time.time() < deadline and not (out_bus.sent and in_bus.sent):
+        _time.sleep(0.01)
+
+    worker.stop()
+    th.join(timeout=1.0)
+
+    assert [m.arbitration_id for m in out_bus.sent] == [0x200]
+    assert [m.arbitration_id for m in in_bus.sent] == [0x300]
+    # The selector dispatches to the handlers run() built; they are built once per open
+    assert len(built) == 1
+
+
+def test_selector_not_used_without_fileno():
+    """Buses without fileno() fall back to sequential polling."""
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={})
+    worker.input_bus = cast(can.BusABC, FakeBus())
+    worker.output_bus = cast(can.BusABC, FakeBus())
+    assert worker._make_selector(*worker._make_rx_handlers()) is None
+
+
+def test_passthrough_forwards_received_message_without_copy(monkeypatch):
+    """Frames without a rewrite rule are sent as the very object that was received."""
+    msg = can.Message(arbitration_id=0x321, data=b"\x07", is_extended_id=False)
+    in_bus = FakeBus(recv_queue=[msg])
+    out_bus = FakeBus()
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={0x100: 0x200})
+
+    _relay(monkeypatch, worker, in_bus, out_bus, expected=1)
+
+    assert out_bus.sent == [msg]
+    assert out_bus.sent[0] is msg
+
+
+def test_rx_handler_drains_queued_burst_per_wakeup(monkeypatch):
+    """One handler call consumes frames already queued by the driver, up to the burst cap."""
+    monkeypatch.setattr("core.can_logic._RX_BURST_MAX", 2)
+    frames = [
+        can.Message(arbitration_id=0x100 + i, data=b"\x01", is_extended_id=False) for i in range(3)
+    ]
+    in_bus = FakeBus(recv_queue=frames)
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={0x100: 0x200})
+    worker.input_bus = cast(can.BusABC, in_bus)
+    worker.output_bus = cast(can.BusABC, FakeBus())
+
+    handle_in, _handle_out = worker._make_rx_handlers()
+    handle_in(0.0)
+    assert worker._tx_queue_to_output.qsize() == 2
+    assert in_bus._in_q == frames[2:]
+
+    handle_in(0.0)
+    assert worker._tx_queue_to_output.qsize() == 3
+    assert len(worker._rx_batch) == 3
+
+
+def test_rule_table_splits_standard_and_extended_ids():
+    """11-bit rules compile to an array; extended-ID rules spill over into a dict."""
+    dense = CANWorker(input_config={}, output_config={}, rewrite_rules={0x1: 0x10, 0x2: 0x20})
+    assert dense._rules_table is not None
+    assert dense._rules_table[0x1] == 0x10
+    assert dense._rules_table[0x0] == -1
+
+    sparse = CANWorker(input_config={}, output_config={}, rewrite_rules={0x7FF: 0x1})
+    assert sparse._rules_table is not None and len(sparse._rules_table) == 0x800
+
+    mixed = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={0x10: 0x11, 0x18FF0000: 0x1}
+    )
+    assert mixed._rules_table is not None and len(mixed._rules_table) == 0x11
+    assert mixed._rules_get(0x18FF0000, -1) == 0x1
+    assert mixed._rules_get(0x10, -1) == -1
+
+    extended = CANWorker(input_config={}, output_config={}, rewrite_rules={0x18FF0000: 0x1})
+    assert extended._rules_table is None
+
+
+def test_rule_table_rewrites_and_passes_through(monkeypatch):
+    """Table lookup rewrites matching IDs and passes through IDs beyond the table."""
+    frames = [
+        can.Message(arbitration_id=0x2, data=b"\x01", is_extended_id=False),
+        can.Message(arbitration_id=0x7FF, data=b"\x02", is_extended_id=False),
+    ]
+    in_bus = FakeBus(recv_queue=frames)
+    out_bus = FakeBus()
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={0x1: 0x10, 0x2: 0x20})
+
+    _relay(monkeypatch, worker, in_bus, out_bus, expected=2)
+
+    assert [m.arbitration_id for m in out_bus.sent] == [0x20, 0x7FF]
+
+
+def test_drop_oldest_policy_keeps_newest_frames():
+    """With drop-oldest, a full TX queue evicts the oldest pending frame instead of blocking."""
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={}, tx_queue_size=2, tx_drop_oldest=True
+    )
+    frames = [can.Message(arbitration_id=i, is_extended_id=False) for i in range(4)]
+    for msg in frames:
+        worker._enqueue_tx(worker._tx_queue_to_output, msg)
+
+    pending = [worker._tx_queue_to_output.get_nowait().arbitration_id for _ in range(2)]
+    assert pending == [2, 3]
+    assert worker._tx_dropped == 2
+
+
+def test_drop_oldest_reports_counts_in_batches():
+    """Evictions are reported as one aggregated count per interval, not once per frame."""
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={}, tx_queue_size=1, tx_drop_oldest=True
+    )
+    reports: list[int] = []
+    worker.tx_frames_dropped.connect(reports.append)
+
+    for i in range(5):
+        worker._enqueue_tx(worker._tx_queue_to_output, can.Message(arbitration_id=i))
+    worker._report_tx_drops()
+    worker._enqueue_tx(worker._tx_queue_to_output, can.Message(arbitration_id=5))
+    worker._report_tx_drops()
+    assert reports == [4]
+
+    worker._report_tx_drops(force=True)
+    assert reports == [4, 1]
+
+
+def test_failed_send_is_counted_as_drop_and_relay_continues(monkeypatch):
+    """A frame that fails to send is reported as dropped; it neither errors nor stops the relay."""
+    frames = [can.Message(arbitration_id=i, is_extended_id=False) for i in (0x10, 0x11)]
+    in_bus = FakeBus(recv_queue=frames)
+    failed: list[can.Message] = []
+
+    def fail_first(msg: can.Message) -> None:
+        if not failed:
+            failed.append(msg)
+            raise can.CanOperationError("transient TX error")
+        out_bus.sent.append(msg)
+
+    out_bus = FakeBus(send_behavior=fail_first)
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={})
+    errors: list[str] = []
+    drops: list[int] = []
+    # Emitted from the TX pump thread: deliver directly, there is no event loop here
+    worker.error_occurred.connect(errors.append, type=Qt.ConnectionType.DirectConnection)
+    worker.tx_frames_dropped.connect(drops.append, type=Qt.ConnectionType.DirectConnection)
+
+    _relay(monkeypatch, worker, in_bus, out_bus, expected=1)
+
+    assert [m.arbitration_id for m in out_bus.sent] == [0x11]
+    assert errors == []
+    assert drops == [1]
+
+
+def test_adaptive_tx_gap_grows_and_shrinks():
+    """Sustained slow sends widen the TX gap; sustained fast sends narrow it back."""
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={}, tx_min_gap=0.0, adaptive_tx_gap=True
+    )
+    to_output, to_input = worker._tx_pacing
+    t = 100.0
+    for _ in range(50):
+        to_output.update(0.010, t)
+        t += 0.05
+    grown = to_output.min_gap
+    assert 0.0 < grown <= 0.02
+    # The other direction keeps its own state
+    assert to_input.min_gap == 0.0
+
+    for _ in range(400):
+        to_output.update(0.0, t)
+        t += 0.1
+    assert to_output.min_gap < grown
+
+
+def test_overflow_detection_uses_errno_and_text():
+    """TX overflow is recognised from ENOBUFS causes and from backend error text."""
+    err = can.CanOperationError("Failed to transmit")
+    err.__cause__ = OSError(errno.ENOBUFS, "No buffer space available")
+    assert _is_tx_overflow(err)
+    assert _is_tx_overflow(can.CanError("Transmit buffer overflow -13"))
+    assert not _is_tx_overflow(can.CanError("Bus is not ready"))
+
+    busy = can.CanOperationError("Failed to transmit")
+    busy.__cause__ = OSError(errno.EAGAIN, "Resource temporarily unavailable")
+    assert _is_tx_overflow(busy)
+    # A structured errno wins over misleading text
+    down = can.CanOperationError("Failed to transmit: rx overflow counter set")
+    down.__cause__ = OSError(errno.ENETDOWN, "Network is down")
+    assert not _is_tx_overflow(down)
+
+
+def test_overflow_detection_uses_vendor_error_codes():
+    """Known backends are classified by error_code without looking at the message."""
+    from can.interfaces.vector.exceptions import VectorOperationError
+
+    assert _is_tx_overflow(VectorOperationError(11, "XL_ERR_QUEUE_IS_FULL", "xlCanTransmit"))
+    assert not _is_tx_overflow(
+        VectorOperationError(118, "XL_ERR_WRONG_PARAMETER overflow", "xlCanTransmit")
+    )
+
+
+def test_unmapped_frames_filtered_when_not_forwarded(monkeypatch):
+    """With forward_unmapped=False only rule IDs are relayed, and the bus gets matching filters."""
+    frames = [
+        can.Message(arbitration_id=0x100, data=b"\x01", is_extended_id=False),
+        can.Message(arbitration_id=0x555, data=b"\x02", is_extended_id=False),
+    ]
+    in_bus = FakeBus(recv_queue=frames)
+    out_bus = FakeBus()
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={0x100: 0x200}, forward_unmapped=False
+    )
+
+    filters: list = []
+    in_bus.set_filters = filters.extend  # type: ignore[attr-defined]
+    worker._apply_input_filters(cast(can.BusABC, in_bus))
+    assert filters == [
+        {"can_id": 0x100, "can_mask": 0x7FF, "extended": False},
+        {"can_id": 0x100, "can_mask": 0x1FFFFFFF, "extended": True},
+    ]
+
+    _relay(monkeypatch, worker, in_bus, out_bus, expected=1)
+    assert [m.arbitration_id for m in out_bus.sent] == [0x200]
+
+
+def test_input_filters_agree_with_rules_for_small_extended_ids(monkeypatch):
+    """An extended frame with an ID <= 0x7FF passes the driver filter and the rule lookup."""
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={0x100: 0x200}, forward_unmapped=False
+    )
+    rx_bus = can.Bus(interface="virtual", channel="filters_small_ext")
+    tx_bus = can.Bus(interface="virtual", channel="filters_small_ext")
+    try:
+        worker._apply_input_filters(rx_bus)
+        frames = [
+            can.Message(arbitration_id=0x100, is_extended_id=True),
+            can.Message(arbitration_id=0x100, is_extended_id=False),
+            can.Message(arbitration_id=0x101, is_extended_id=True),
+        ]
+        for frame in frames:
+            tx_bus.send(frame)
+        received = []
+        while (msg := rx_bus.recv(timeout=0.1)) is not None:
+            received.append((msg.arbitration_id, msg.is_extended_id))
+    finally:
+        tx_bus.shutdown()
+        rx_bus.shutdown()
+
+    assert received == [(0x100, True), (0x100, False)]
+
+    # The frames the driver lets through are the ones the software lookup rewrites
+    passed = [can.Message(arbitration_id=arb, is_extended_id=ext) for arb, ext in received]
+    in_bus = FakeBus(recv_queue=passed)
+    out_bus = FakeBus()
+    _relay(monkeypatch, worker, in_bus, out_bus, expected=2)
+    assert [(m.arbitration_id, m.is_extended_id) for m in out_bus.sent] == [
+        (0x200, True),
+        (0x200, False),
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="select() needs sockets on Windows")
+def test_stop_wakes_idle_selector_wait(monkeypatch):
+    """An idle worker blocks in select() without a timeout; stop() wakes it via the pipe."""
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={})
+    worker.input_bus = cast(can.BusABC, PollableFakeBus())
+    worker.output_bus = cast(can.BusABC, PollableFakeBus())
+    monkeypatch.setattr(worker, "_open_buses", lambda: True)
+
+    th = _run_worker_in_thread(worker)
+    _time.sleep(0.2)
+    assert th.is_alive()
+
+    worker.stop()
+    th.join(timeout=1.0)
+    assert not th.is_alive()
+    assert worker._wake_r is None and worker._wake_w is None
+
+
+def test_polling_backends_receive_each_direction_independently(monkeypatch):
+    """Without fileno(), a blocking recv on Input does not hold up Output -> Input frames."""
+
+    class BlockingBus(FakeBus):
+        def recv(self, timeout: float | None = None) -> can.Message | None:  # noqa: ARG002
+            _time.sleep(0.5)
+            return None
+
+    in_bus = BlockingBus()
+    out_bus = FakeBus(recv_queue=[can.Message(arbitration_id=0x42, is_extended_id=False)])
+    worker = CANWorker(input_config={}, output_config={}, rewrite_rules={})
+    worker.input_bus = cast(can.BusABC, in_bus)
+    worker.output_bus = cast(can.BusABC, out_bus)
+    monkeypatch.setattr(worker, "_open_buses", lambda: True)
+
+    th = _run_worker_in_thread(worker)
+    deadline = _time.time() + 0.3
+    while _time.time() < deadline and not in_bus.sent:
+        _time.sleep(0.01)
+    forwarded = [m.arbitration_id for m in in_bus.sent]
+    worker.stop()
+    th.join(timeout=2.0)
+
+    assert forwarded == [0x42]
+
+
+def test_stop_interrupts_recovery_delay(monkeypatch):
+    """stop() ends the wait between recovery attempts instead of sleeping it out."""
+    worker = CANWorker(
+        input_config={}, output_config={}, rewrite_rules={}, max_retries=3, retry_delay=5.0
+    )
+    opened: list[bool] = []
+    monkeypatch.setattr(worker, "_open_buses", lambda: opened.append(True) or True)
+
+    result: list[bool] = []
+    th = threading.Thread(target=lambda: result.append(worker._attempt_recovery()), daemon=True)
+    start = _time.monotonic()
+    th.start()
+    _time.sleep(0.05)
+    worker.stop()
+    th.join(timeout=1.0)
+
+    assert not th.is_alive()
+    assert _time.monotonic() - start < 1.0
+    assert result == [False] and opened == []
@@ -4,12 +4,14 @@ Also covers selected NFRs where feasible via GUI-level checks.
 """
 
 import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from PyQt6.QtWidgets import QTableWidgetItem
 
+import core.can_logic as can_logic_mod
 import core.gui as gui_mod
 from core.can_logic import CANManager
 from core.gui import MainWindow
@@ -106,6 +108,293 @@ def test_channel_detection_signal(mock_detect_kvaser, mock_detect_win, mock_dete
     assert mock_detect_win.called or mock_detect_linux.called
 
 
+def test_channel_detection_runs_backends_concurrently(monkeypatch):
+    """Backend probes overlap, and a failing backend does not hide the others."""
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def kvaser(_self):
+        barrier.wait()
+        return [{"interface": "kvaser", "channel": "0", "display_name": "Kvaser Channel 0"}]
+
+    def platform_probe(_self):
+        barrier.wait()
+        raise RuntimeError("backend exploded")
+
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_kvaser_devices", kvaser)
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_windows_can_devices", platform_probe)
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_linux_can_devices", platform_probe)
+    monkeypatch.setattr("core.can_logic._PLATFORM", "Linux")
+
+    manager = CANManager()
+    detected: list[dict] = []
+    manager.channels_detected.connect(detected.extend)
+    manager.detect_channels()
+
+    assert [ch["interface"] for ch in detected] == ["virtual", "virtual", "kvaser"]
+
+
+def test_channel_detection_reuses_recent_results(monkeypatch):
+    """A second detection within the cache window skips the backends unless refreshed."""
+    calls = []
+
+    def kvaser(_self):
+        calls.append("kvaser")
+        return []
+
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_kvaser_devices", kvaser)
+    monkeypatch.setattr("core.can_logic._PLATFORM", "Other")
+
+    manager = CANManager()
+    emitted: list[list] = []
+    manager.channels_detected.connect(emitted.append)
+
+    manager.detect_channels()
+    manager.detect_channels()
+    assert calls == ["kvaser"]
+    assert emitted[0] == emitted[1]
+
+    manager.detect_channels(refresh=True)
+    assert calls == ["kvaser", "kvaser"]
+
+
+def test_settings_dialog_uses_cache_and_rescans_on_request(qapp, monkeypatch):
+    """Settings lists cached channels without blocking; Rescan finds adapters plugged later."""
+    from PyQt6.QtCore import QCoreApplication
+
+    from core.settings_dialog import SettingsDialog
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 2.0
+        while not condition() and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+
+    scans = []
+    plugged = {"interface": "kvaser", "channel": "0", "display_name": "Kvaser Channel 0"}
+
+    def kvaser(_self):
+        scans.append(True)
+        return [plugged] if len(scans) > 1 else []
+
+    monkeypatch.setattr("core.can_logic._PLATFORM", "Other")
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_kvaser_devices", kvaser)
+    manager = CANManager()
+    manager.detect_channels()
+
+    dialog = SettingsDialog(can_manager=manager)
+    # Selection requested before the asynchronous list arrives is applied with it
+    dialog.set_settings({"connection": {"input_channel_index": 1, "output_channel_index": 0}})
+    wait_for(lambda: dialog.input_channel_combo.count() == 2)
+    assert len(scans) == 1
+    assert dialog.input_channel_combo.currentIndex() == 1
+    assert dialog.output_channel_combo.currentIndex() == 0
+
+    dialog.rescan_channels_button.click()
+    wait_for(lambda: dialog.input_channel_combo.count() == 3)
+    assert len(scans) == 2
+    assert plugged in dialog._channels
+    # The channels shown before the rescan stay selected
+    assert dialog.input_channel_combo.currentIndex() == 1
+    assert dialog.output_channel_combo.currentIndex() == 0
+    assert dialog.rescan_channels_button.isEnabled()
+
+
+def test_window_detects_channels_off_the_gui_thread(qapp, monkeypatch):
+    """MainWindow starts detection in the background and fills the combos when it arrives."""
+    from PyQt6.QtCore import QCoreApplication
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def kvaser(_self):
+        started.set()
+        release.wait(timeout=2.0)
+        return [{"interface": "kvaser", "channel": "0", "display_name": "Kvaser 0"}]
+
+    monkeypatch.setattr(gui_mod.CANManager, "_detect_kvaser_devices", kvaser)
+    monkeypatch.setattr("core.can_logic._PLATFORM", "Other")
+
+    win = MainWindow()
+    # The constructor returned while detection is still blocked in the backend
+    assert started.wait(timeout=2.0)
+    assert win.status_label.text() == "Detecting channels…"
+    release.set()
+
+    deadline = time.monotonic() + 2.0
+    while win.input_channel_combo.count() == 0 and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    assert win.input_channel_combo.count() == 3
+    assert win.status_label.text() == "Disconnected"
+
+
+def test_device_detection_enumerates_without_opening_buses(monkeypatch):
+    """Kvaser and PCAN channels come from the library enumeration, not from probe opens."""
+    from can.interfaces.kvaser import KvaserBus
+    from can.interfaces.pcan import PcanBus
+
+    def fail_open(*_args, **_kwargs):
+        raise AssertionError("detection must not open a bus")
+
+    configs = {
+        "kvaser": [{"interface": "kvaser", "channel": 1}],
+        "pcan": [{"interface": "pcan", "channel": "PCAN_USBBUS2"}],
+    }
+    monkeypatch.setattr(KvaserBus, "__init__", fail_open)
+    monkeypatch.setattr(PcanBus, "__init__", fail_open)
+    monkeypatch.setattr(
+        can_logic_mod.can,
+        "detect_available_configs",
+        lambda interfaces: [c for name in interfaces for c in configs.get(name, [])],
+    )
+
+    manager = CANManager()
+
+    assert manager._detect_kvaser_devices() == [
+        {"interface": "kvaser", "channel": "1", "display_name": "Kvaser Channel 1"}
+    ]
+    pcan = [ch for ch in manager._detect_windows_can_devices() if ch["interface"] == "pcan"]
+    assert pcan == [
+        {"interface": "pcan", "channel": "PCAN_USBBUS2", "display_name": "PCAN PCAN_USBBUS2"}
+    ]
+
+
+def test_vector_detection_selects_channel_by_serial(qapp, monkeypatch):
+    """Vector channels carry serial and global channel index through to the bus config."""
+    import ctypes
+
+    vector_configs = [
+        {"interface": "vector", "channel": 0, "serial": 1001, "channel_index": 2},
+        {"interface": "vector", "channel": 0, "serial": 1002, "channel_index": 4},
+    ]
+    monkeypatch.setattr(ctypes, "WinDLL", lambda _name: object(), raising=False)
+    monkeypatch.setattr(
+        can_logic_mod.can,
+        "detect_available_configs",
+        lambda interfaces: vector_configs if interfaces == ["vector"] else [],
+    )
+
+    channels = CANManager()._detect_windows_can_devices()
+    assert channels == [
+        {
+            "interface": "vector",
+            "channel": "0",
+            "serial": 1001,
+            "channel_index": 2,
+            "display_name": "Vector 1001 Channel 0",
+        },
+        {
+            "interface": "vector",
+            "channel": "0",
+            "serial": 1002,
+            "channel_index": 4,
+            "display_name": "Vector 1002 Channel 0",
+        },
+    ]
+
+    # Same channel number on two devices is a valid pair, and the selectors reach can.Bus
+    win = MainWindow()
+    win._populate_channel_selectors(channels)
+    win.input_channel_combo.setCurrentIndex(0)
+    win.output_channel_combo.setCurrentIndex(1)
+    win.mapping_table.setRowCount(0)
+    captured = {}
+    monkeypatch.setattr(
+        win.can_manager,
+        "start_retransmission",
+        lambda input_cfg, output_cfg, rules, log_file: captured.update(
+            input=input_cfg, output=output_cfg
+        ),
+    )
+
+    win._on_start_stop_clicked()
+
+    assert captured["input"] == {
+        "interface": "vector",
+        "channel": "0",
+        "serial": 1001,
+        "channel_index": 2,
+        "bitrate": captured["input"]["bitrate"],
+    }
+    assert captured["output"]["serial"] == 1002
+    assert captured["output"]["channel_index"] == 4
+
+
+def test_linux_detection_prefers_netlink(monkeypatch):
+    """With pyroute2 available, only links of kind 'can' are reported and no subprocess runs."""
+    import subprocess
+    import sys
+    import types
+
+    class Attrs:
+        def __init__(self, **attrs):
+            self._attrs = attrs
+
+        def get_attr(self, name):
+            return self._attrs.get(name)
+
+    links = [
+        Attrs(IFLA_IFNAME="can0", IFLA_LINKINFO=Attrs(IFLA_INFO_KIND="can")),
+        Attrs(IFLA_IFNAME="vcan0", IFLA_LINKINFO=Attrs(IFLA_INFO_KIND="vcan")),
+        Attrs(IFLA_IFNAME="lo", IFLA_LINKINFO=None),
+    ]
+
+    class FakeIPRoute:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get_links(self):
+            return links
+
+    def no_subprocess(*_args, **_kwargs):
+        raise AssertionError("netlink path must not spawn ip")
+
+    monkeypatch.setitem(sys.modules, "pyroute2", types.SimpleNamespace(IPRoute=FakeIPRoute))
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+
+    channels = CANManager()._detect_linux_can_devices()
+    assert channels == [
+        {"interface": "socketcan", "channel": "can0", "display_name": "SocketCAN can0"}
+    ]
+
+
+def _failing_pyroute2():
+    import types
+
+    class FailingIPRoute:
+        def __init__(self):
+            raise OSError("netlink socket not permitted")
+
+    return types.SimpleNamespace(IPRoute=FailingIPRoute)
+
+
+@pytest.mark.parametrize(
+    "pyroute2_module", [None, _failing_pyroute2()], ids=["missing", "netlink-error"]
+)
+def test_linux_detection_falls_back_to_interface_names(monkeypatch, pyroute2_module):
+    """Without a working pyroute2, canN interfaces are picked from if_nameindex()."""
+    import socket
+    import subprocess
+    import sys
+
+    def no_subprocess(*_args, **_kwargs):
+        raise AssertionError("fallback must not spawn ip")
+
+    monkeypatch.setitem(sys.modules, "pyroute2", pyroute2_module)
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    monkeypatch.setattr(
+        socket,
+        "if_nameindex",
+        lambda: [(1, "lo"), (3, "can0"), (4, "can1"), (5, "vcan0"), (6, "canary")],
+    )
+
+    channels = CANManager()._detect_linux_can_devices()
+    assert [ch["channel"] for ch in channels] == ["can0", "can1"]
+
+
 # --- GUI behavior tests (REQ-FUNC-INT-002 .. 010) ---
 
 
@@ -219,10 +508,10 @@ def test_latest_frames_view_exists(qapp):
     """
     win = MainWindow()
     # Test both channel frame tables exist and are configured
-    assert win.frames_table_RX_Channel0.columnCount() == 4
-    assert win.frames_table_TX_Channel0.columnCount() == 4
-    assert win.frames_table_RX_Channel1.columnCount() == 4
-    assert win.frames_table_TX_Channel1.columnCount() == 4
+    assert win.frames_table_RX_Channel0.model().columnCount() == 4
+    assert win.frames_table_TX_Channel0.model().columnCount() == 4
+    assert win.frames_table_RX_Channel1.model().columnCount() == 4
+    assert win.frames_table_TX_Channel1.model().columnCount() == 4
 
 
 def test_bitrate_applied_on_start(qapp, monkeypatch):
@@ -269,6 +558,34 @@ def test_bitrate_applied_on_start(qapp, monkeypatch):
         assert captured["input"]["bitrate"] == 500000
 
 
+def test_worker_options_applied_on_start(qapp, monkeypatch):
+    """Worker options chosen in Settings reach the manager when starting."""
+    win = MainWindow()
+    channels = [
+        {"interface": "virtual", "channel": "vcan0", "display_name": "Virtual Channel 0"},
+        {"interface": "virtual", "channel": "vcan1", "display_name": "Virtual Channel 1"},
+    ]
+    win._populate_channel_selectors(channels)
+    win.input_channel_combo.setCurrentIndex(0)
+    win.output_channel_combo.setCurrentIndex(1)
+    win.mapping_table.setRowCount(0)
+    win.current_settings["connection"]["forward_unmapped"] = False
+    win.current_settings["throttling"]["tx_queue_size"] = "32"
+    win.current_settings["throttling"]["tx_drop_oldest"] = True
+    win.current_settings["throttling"]["adaptive_tx_gap"] = True
+
+    captured = {}
+    monkeypatch.setattr(win.can_manager, "set_throttle_options", captured.update)
+    monkeypatch.setattr(win.can_manager, "start_retransmission", lambda *args: None)
+
+    win._on_start_stop_clicked()
+
+    assert captured["forward_unmapped"] is False
+    assert captured["tx_queue_size"] == 32
+    assert captured["tx_drop_oldest"] is True
+    assert captured["adaptive_tx_gap"] is True
+
+
 def test_mapping_table_used_on_start(qapp, monkeypatch):
     """
     REQ-FUNC-INT-006: The user-defined ID mapping table is parsed and applied when starting.
@@ -352,18 +669,100 @@ def test_ui_timestamps_include_milliseconds(qapp):
 
     ts = 1726480000.1234
     # Test adding frame to channel 1 (input channel)
-    win._add_received_frame_to_view(DummyMsg(ts), channel=1)
+    win._add_received_frames_to_view([(DummyMsg(ts), 1)])
 
     # Read back the timestamp text from the RX table for channel 1
-    item = win.frames_table_RX_Channel1.item(0, 0)
-    assert item is not None
-    text = item.text()
+    text = win.frames_table_RX_Channel1.model().index(0, 0).data()
+    assert text is not None
 
     # Expect exactly 3 decimals as per GUI formatting and close to original
     assert "." in text and len(text.split(".")[-1]) == 3
     assert abs(float(text) - ts) < 0.002  # within 2 ms
 
 
+def test_frame_batches_fill_channel_tables(qapp):
+    """Batched (msg, channel) frames are routed to the RX/TX table of their channel."""
+    win = MainWindow()
+    win.is_running = True
+
+    class DummyMsg:
+        def __init__(self, arbitration_id: int) -> None:
+            self.timestamp = 1.0
+            self.arbitration_id = arbitration_id
+            self.dlc = 1
+            self.data = bytes([0x01])
+
+    win._add_received_frames_to_view([(DummyMsg(0x100), 1), (DummyMsg(0x200), 0)])
+    win._add_transmitted_frames_to_view([(DummyMsg(0x300), 0)])
+
+    assert win.frames_table_RX_Channel1.model().rowCount() == 1
+    assert win.frames_table_RX_Channel0.model().rowCount() == 1
+    assert win.frames_table_TX_Channel0.model().rowCount() == 1
+    assert win.frames_table_TX_Channel0.model().index(0, 1).data() == "300"
+
+
+def test_frame_data_column_is_not_sized_to_contents(qapp):
+    """The streaming data column has a preset width instead of per-update content measuring."""
+    from PyQt6.QtWidgets import QHeaderView
+
+    win = MainWindow()
+    header = win.frames_table_RX_Channel0.horizontalHeader()
+    assert header.sectionResizeMode(3) == QHeaderView.ResizeMode.Interactive
+    assert header.sectionSize(3) >= win.frames_table_RX_Channel0.fontMetrics().horizontalAdvance(
+        "F" * 16
+    )
+
+
+def test_status_indicator_style_only_reapplied_on_colour_change(qapp, monkeypatch):
+    """Status text always updates; the indicator stylesheet is only set when the colour changes."""
+    win = MainWindow()
+    styles: list[str] = []
+    monkeypatch.setattr(win.status_indicator, "setStyleSheet", styles.append)
+
+    win.update_status("Retransmitting", "green")
+    win.update_status("Retransmitting (3 frames dropped)", "orange")
+    win.update_status("Retransmitting (7 frames dropped)", "orange")
+
+    assert win.status_label.text() == "Retransmitting (7 frames dropped)"
+    assert styles == [
+        "background-color: green; border-radius: 10px;",
+        "background-color: orange; border-radius: 10px;",
+    ]
+
+
+def test_frame_table_keeps_newest_rows_first(qapp):
+    """The frame model shows the newest frames on top and drops the oldest past its capacity."""
+    from core.gui import _FRAME_TABLE_ROWS, FrameTableModel
+
+    class DummyMsg:
+        def __init__(self, arbitration_id: int) -> None:
+            self.timestamp = 1.0
+            self.arbitration_id = arbitration_id
+            self.dlc = 0
+            self.data = b""
+
+    model = FrameTableModel()
+    model.add_frames([DummyMsg(i) for i in range(3)])
+    assert [model.index(r, 1).data() for r in range(model.rowCount())] == ["2", "1", "0"]
+
+    model.add_frames([DummyMsg(0x100 + i) for i in range(_FRAME_TABLE_ROWS)])
+    assert model.rowCount() == _FRAME_TABLE_ROWS
+    assert model.index(0, 1).data() == f"{0x100 + _FRAME_TABLE_ROWS - 1:X}"
+    assert model.index(_FRAME_TABLE_ROWS - 1, 1).data() == "100"
+
+
+def test_dropped_frames_shown_without_stopping(qapp):
+    """Drop reports accumulate in the status line and do not end the run."""
+    win = MainWindow()
+    win.is_running = True
+
+    win._on_tx_frames_dropped(3)
+    win._on_tx_frames_dropped(2)
+
+    assert win.is_running
+    assert win.status_label.text() == "Retransmitting (5 frames dropped)"
+
+
 def test_about_dialog_contains_disclaimer(qapp, monkeypatch):
     """
     REQ-NFR-SAF-001, REQ-NFR-SAF-002: The About dialog presents a disclaimer
@@ -622,6 +1021,7 @@ def test_settings_dialog_get_set_settings(qapp):
             "input_channel_index": 1,
             "output_channel_index": 2,
             "bitrate": "1000",
+            "forward_unmapped": False,
         },
         "logging": {
             "log_file_path": "/test/path/logfile.csv",
@@ -631,6 +1031,9 @@ def test_settings_dialog_get_set_settings(qapp):
             "send_retry_initial_delay": "0.02",
             "tx_min_gap": "0.001",
             "tx_overflow_cooldown": "0.1",
+            "adaptive_tx_gap": True,
+            "tx_queue_size": "64",
+            "tx_drop_oldest": True,
         },
     }
     
@@ -638,8 +1041,12 @@ def test_settings_dialog_get_set_settings(qapp):
     retrieved_settings = dialog.get_settings()
     
     assert retrieved_settings["connection"]["bitrate"] == "1000"
+    assert retrieved_settings["connection"]["forward_unmapped"] is False
     assert retrieved_settings["logging"]["log_file_path"] == "/test/path/logfile.csv"
     assert retrieved_settings["throttling"]["max_send_retries"] == "5"
+    assert retrieved_settings["throttling"]["adaptive_tx_gap"] is True
+    assert retrieved_settings["throttling"]["tx_queue_size"] == "64"
+    assert retrieved_settings["throttling"]["tx_drop_oldest"] is True
 
 
 def test_settings_file_save_load(qapp, tmp_path):
@@ -198,3 +198,135 @@ def test_frame_logger_no_logging_active():
     
     # Try to log a frame - should return early without error
     logger.log_frame("RX", DummyMsg(0x123, bytes([0xAB]), 1, 1000.0), 0)
+
+
+def test_frame_logger_logs_batches():
+    """A batch of (msg, channel) frames is written as consecutive rows in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_path = Path(tmpdir) / "test_batch_log.csv"
+
+        logger = FrameLogger()
+        logger.set_log_path(str(log_path))
+        logger.start_logging()
+        logger.log_frames(
+            "RX",
+            [
+                (DummyMsg(0x100, bytes([0x01]), 1, 1000.0), 1),
+                (DummyMsg(0x101, bytes([0x02, 0x03]), 2, 1000.5), 0),
+            ],
+        )
+        logger.stop_logging()
+
+        with log_path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+    assert rows[1] == ["1000.000", "1", "RX", "100", "1", "01"]
+    assert rows[2] == ["1000.500", "0", "RX", "101", "2", "0203"]
+
+
+def test_frame_logger_output_matches_csv_writer(tmp_path):
+    """Directly formatted rows are byte-identical to what csv.writer produced."""
+    import io
+
+    log_path = tmp_path / "test_bytes_log.csv"
+    logger = FrameLogger()
+    logger.set_log_path(str(log_path))
+    logger.start_logging()
+    logger.log_frames("TX", [(DummyMsg(0x18FF00, bytes([0xDE, 0xAD]), 2, 12.3456), 1)])
+    logger.stop_logging()
+
+    expected = io.StringIO(newline="")
+    writer = csv.writer(expected)
+    writer.writerow(["Timestamp", "Channel", "Direction", "ID", "DLC", "Data"])
+    writer.writerow(["12.346", 1, "TX", "18FF00", 2, "DEAD"])
+    assert log_path.read_bytes() == expected.getvalue().encode("utf-8")
+
+
+def test_frame_logger_writes_blf_for_blf_path(tmp_path):
+    """A .blf path selects binary BLF output carrying channel and direction per record."""
+    import can
+
+    log_path = tmp_path / "test_log.blf"
+    logger = FrameLogger()
+    logger.set_log_path(str(log_path))
+    logger.start_logging()
+    logger.log_frames("RX", [(can.Message(arbitration_id=0x123, data=[1, 2], timestamp=10.0), 1)])
+    logger.log_frames("TX", [(can.Message(arbitration_id=0x321, data=[1, 2], timestamp=10.5), 0)])
+    logger.stop_logging()
+    assert not logger.is_logging
+
+    with can.BLFReader(str(log_path)) as reader:
+        records = list(reader)
+    assert [(m.arbitration_id, m.channel, m.is_rx) for m in records] == [
+        (0x123, 1, True),
+        (0x321, 0, False),
+    ]
+    assert records[0].data == bytearray([1, 2])
+
+
+def test_manager_logs_on_dedicated_thread(qapp, tmp_path):
+    """Frames relayed by the manager are written by a logger thread and flushed on stop."""
+    import time
+
+    import can
+
+    from core.can_logic import CANManager
+
+    log_path = tmp_path / "manager_log.csv"
+    manager = CANManager()
+    manager.start_retransmission(
+        {"interface": "virtual", "channel": "log_in"},
+        {"interface": "virtual", "channel": "log_out"},
+        {0x123: 0x321},
+        str(log_path),
+    )
+    assert manager._logger_thread is not None
+    assert manager._frame_logger is not None
+    assert manager._frame_logger.thread() is manager._logger_thread
+
+    sender = can.Bus(interface="virtual", channel="log_in")
+    try:
+        time.sleep(0.2)
+        sender.send(can.Message(arbitration_id=0x123, data=[1], is_extended_id=False))
+        time.sleep(0.3)
+    finally:
+        sender.shutdown()
+        manager.stop_retransmission()
+
+    with log_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    # RX and TX batches are flushed independently, so only the set of rows is fixed
+    assert sorted(row[2:4] for row in rows[1:]) == [["RX", "123"], ["TX", "321"]]
+
+
+def test_manager_closes_log_when_worker_fails(qapp, tmp_path):
+    """A worker that fails to open its buses stops the logger thread and closes the file."""
+    import time
+
+    from PyQt6.QtCore import QCoreApplication
+
+    from core.can_logic import CANManager
+
+    log_path = tmp_path / "failed_run.csv"
+    manager = CANManager()
+    errors: list[str] = []
+    manager.error_occurred.connect(errors.append)
+    manager.start_retransmission(
+        {"interface": "no_such_interface", "channel": "0"},
+        {"interface": "no_such_interface", "channel": "1"},
+        {},
+        str(log_path),
+    )
+    logger_thread = manager._logger_thread
+    assert logger_thread is not None
+
+    deadline = time.monotonic() + 2.0
+    while manager._frame_logger is not None and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+
+    assert errors
+    assert manager._frame_logger is None
+    assert manager._logger_thread is None
+    assert not logger_thread.isRunning()
+    manager.stop_retransmission()